@@ -12,12 +12,14 @@ from virtool.analyses.files import create_analysis_file
 from virtool.analyses.models import AnalysisFile
 from virtool.pg.utils import get_row_by_id
 
+AODP_REFERENCE_PATH = (
+    Path(__file__).parent.parent / "test_files" / "aodp" / "reference.fa"
+)
+
 
 @pytest.fixture
 def files(tmp_path):
-    path = Path.cwd() / "tests" / "test_files" / "aodp" / "reference.fa"
-
-    data = {"file": open(path, "rb")}
+    data = {"file": open(AODP_REFERENCE_PATH, "rb")}
 
     return data
 
@@ -247,6 +249,7 @@ async def test_remove(mocker, error, fake, spawn_client, resp_is, tmp_path):
 
 
 @pytest.mark.parametrize("error", [None, 400, 404, 422])
+@pytest.mark.postgres
 async def test_upload_file(
     error, files, resp_is, spawn_job_client, static_time, snapshot, pg, tmp_path
 ):
@@ -297,6 +300,7 @@ async def test_upload_file(
 
 @pytest.mark.parametrize("file_exists", [True, False])
 @pytest.mark.parametrize("row_exists", [True, False])
+@pytest.mark.postgres
 async def test_download_analysis_result(
     file_exists, row_exists, files, spawn_client, spawn_job_client, snapshot, tmp_path
 ):
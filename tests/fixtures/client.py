@@ -5,7 +5,10 @@ import aiohttp
 import pytest
 import virtool.app
 import virtool.jobs.main
+import virtool.startup
+from aiohttp.web import Application
 from aiohttp.web_routedef import RouteTableDef
+from sqlalchemy.ext.asyncio import AsyncEngine
 from virtool.config.cls import Config
 from virtool.utils import hash_key
 
@@ -56,10 +59,28 @@ class VirtoolTestClient:
         return await self._test_client.delete(url)
 
 
+def use_test_postgres(app: Application, pg: AsyncEngine):
+    """
+    Give ``app`` the engine from the :func:`pg` fixture instead of letting it connect to
+    Postgres and create the schema itself on startup.
+
+    This also lets application tests run against the SQLite test backend.
+
+    """
+
+    async def _startup_test_postgres(app):
+        app["pg"] = pg
+
+    app.on_startup[
+        app.on_startup.index(virtool.startup.startup_postgres)
+    ] = _startup_test_postgres
+
+
 @pytest.fixture
 def create_app(
     create_user,
     dbi,
+    pg,
     pg_connection_string,
     redis_connection_string,
     test_db_connection_string,
@@ -81,7 +102,11 @@ def create_app(
             fake=False,
         )
 
-        return virtool.app.create_app(config)
+        app = virtool.app.create_app(config)
+
+        use_test_postgres(app, pg)
+
+        return app
 
     return _create_app
 
@@ -155,11 +180,15 @@ def spawn_job_client(
     aiohttp_client,
     test_db_connection_string,
     redis_connection_string,
+    pg,
     pg_connection_string,
     pg_session,
     test_db_name,
 ):
-    """A factory method for creating an aiohttp client which can authenticate with the API as a Job."""
+    """
+    A factory method for creating an aiohttp client which can authenticate with the API as a Job.
+
+    """
 
     async def _spawn_job_client(
         authorize: bool = False,
@@ -192,6 +221,8 @@ def spawn_job_client(
             )
         )
 
+        use_test_postgres(app, pg)
+
         if add_route_table:
             app.add_routes(add_route_table)
 
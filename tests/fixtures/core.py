@@ -1,7 +1,9 @@
+import datetime
 import functools
 import shutil
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
 
 import arrow
 import multidict
@@ -22,10 +24,14 @@ class MockRequest:
         self._state[key] = value
 
 
-class StaticTime:
+class StaticTime(NamedTuple):
+    datetime: datetime.datetime
+    iso: str
 
-    datetime = arrow.Arrow(2015, 10, 6, 20, 0, 0).naive
-    iso = "2015-10-06T20:00:00Z"
+
+STATIC_TIME = StaticTime(
+    datetime=arrow.Arrow(2015, 10, 6, 20, 0, 0).naive, iso="2015-10-06T20:00:00Z"
+)
 
 
 @pytest.fixture
@@ -100,7 +106,7 @@ def static_nonce(mocker):
 
 @pytest.fixture(scope="session")
 def static_time_obj():
-    return StaticTime()
+    return STATIC_TIME
 
 
 @pytest.fixture
@@ -1,9 +1,15 @@
+import asyncio
+from typing import Dict, List, Optional, Type
+
 import motor.motor_asyncio
 import pytest
 from aiohttp.test_utils import make_mocked_coro
+from pymongo import InsertOne
+from sqlalchemy import insert
 
 import virtool.db.core
 import virtool.db.mongo
+from virtool.pg.base import Base
 
 
 class MockDeleteResult:
@@ -46,3 +52,40 @@ def id_exists(mocker, request):
 @pytest.fixture
 def create_delete_result():
     return MockDeleteResult
+
+
+@pytest.fixture
+def seed(dbi, pg):
+    """
+    Seed MongoDB collections and Postgres tables in as few round-trips as possible.
+
+    Documents for each collection are inserted with a single unordered ``bulk_write``. Rows
+    for each model are inserted with a single Core ``INSERT`` in one transaction, skipping ORM
+    unit-of-work overhead. Models are inserted in the order they are passed. The Mongo and
+    Postgres writes are independent, so they are run concurrently.
+
+    """
+
+    async def insert_rows(rows: Dict[Type[Base], List[dict]]):
+        async with pg.begin() as conn:
+            for model, values in rows.items():
+                await conn.execute(insert(model), values)
+
+    async def func(
+        collections: Optional[Dict[str, List[dict]]] = None,
+        rows: Optional[Dict[Type[Base], List[dict]]] = None,
+    ):
+        aws = [
+            getattr(dbi, name).bulk_write(
+                [InsertOne(document) for document in documents], ordered=False
+            )
+            for name, documents in (collections or {}).items()
+            if documents
+        ]
+
+        if rows:
+            aws.append(insert_rows(rows))
+
+        await asyncio.gather(*aws)
+
+    return func
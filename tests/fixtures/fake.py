@@ -80,6 +80,15 @@ class FakeUserGenerator(AbstractFakeDataGenerator):
         self._faker = FakerWrapper()
 
     async def create(self) -> Document:
+        return self.build()
+
+    def build(self) -> Document:
+        """
+        Generate a fake user document without inserting it.
+
+        Generators are seeded, so fresh generators always produce the same sequence of users.
+
+        """
         profile = self._faker.profile()
 
         return {
@@ -129,3 +138,26 @@ def app(dbi, pg, tmp_path, config, settings):
 @pytest.fixture
 def fake(dbi):
     return FakeGenerator(dbi)
+
+
+@pytest.fixture(scope="module")
+def fake_user_documents():
+    """
+    Fake user documents generated once per module.
+
+    These are identical to the first documents created by a fresh :class:`FakeGenerator`.
+
+    """
+    generator = FakeUserGenerator(None, None)
+    return [generator.build() for _ in range(2)]
+
+
+@pytest.fixture
+async def fake_user_pool(dbi, fake_user_documents):
+    """
+    Insert the cached fake user documents in a single call and return them.
+
+    """
+    users = [dict(document) for document in fake_user_documents]
+    await dbi.users.insert_many(users)
+    return users
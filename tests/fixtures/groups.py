@@ -1,11 +1,11 @@
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def kings(all_permissions):
     return {"_id": "kings", "permissions": all_permissions}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def peasants(no_permissions):
     return {"_id": "peasants", "permissions": no_permissions}
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-TEST_FILES_PATH = Path.cwd() / "tests" / "test_files"
+TEST_FILES_PATH = Path(__file__).parent.parent / "test_files"
 
 
 @pytest.fixture(scope="session")
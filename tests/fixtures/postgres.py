@@ -1,10 +1,26 @@
+import os
+
 import pytest
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
+from virtool.api.json import pretty_dumps
 from virtool.pg.testing import create_test_database
 from virtool.pg.utils import Base
 
 
+def use_sqlite() -> bool:
+    """
+    Check if the in-memory SQLite test backend was requested using ``VIRTOOL_TEST_PG=sqlite``.
+
+    Tests that rely on PostgreSQL-only SQL, like ``RETURNING``, must be marked ``postgres`` so
+    they are skipped in this mode.
+
+    """
+    return os.environ.get("VIRTOOL_TEST_PG") == "sqlite"
+
+
 @pytest.fixture
 def pg_base_connection_string(request, pg_db_name):
     """
@@ -38,24 +54,61 @@ def pg_connection_string(pg_base_connection_string: str, pg_db_name: str):
     return f"{pg_base_connection_string}/{pg_db_name}"
 
 
+@pytest.fixture(scope="session")
+def pg_rebuilt_databases() -> set:
+    """
+    The names of test databases that have had their schema rebuilt during this session.
+
+    The schema is dropped and recreated the first time a database is used in a session. After
+    that, tests only need the tables emptied.
+
+    """
+    return set()
+
+
 @pytest.fixture
 async def pg(
-    loop, pg_db_name: str, pg_base_connection_string: str, pg_connection_string: str
+    loop,
+    pg_db_name: str,
+    pg_base_connection_string: str,
+    pg_connection_string: str,
+    pg_rebuilt_databases: set,
 ) -> AsyncEngine:
     """
     Return a SQLAlchemy :class:`AsyncEngine` object for an auto-generated test database.
 
-    Test database are specific to xdist workers.
+    Test database are specific to xdist workers. The schema is only rebuilt once per session.
+    Tables are emptied using `TRUNCATE` before each test.
+
+    If ``VIRTOOL_TEST_PG=sqlite`` is set, a fresh in-memory SQLite database is used instead.
 
     """
-    await create_test_database(pg_base_connection_string, pg_db_name)
+    if use_sqlite():
+        pg = create_async_engine(
+            "sqlite+aiosqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+        async with pg.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        return pg
 
-    pg = create_async_engine(pg_connection_string)
+    if pg_db_name not in pg_rebuilt_databases:
+        await create_test_database(pg_base_connection_string, pg_db_name)
+
+    pg = create_async_engine(pg_connection_string, json_serializer=pretty_dumps)
 
     async with pg.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
-        await conn.commit()
+        if pg_db_name not in pg_rebuilt_databases:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+            pg_rebuilt_databases.add(pg_db_name)
+
+        table_names = ", ".join(table.name for table in Base.metadata.sorted_tables)
+
+        await conn.execute(text(f"TRUNCATE {table_names} RESTART IDENTITY CASCADE"))
 
     return pg
 
@@ -66,14 +119,11 @@ async def pg_session(pg: AsyncEngine) -> AsyncSession:
     Return an :class:`AsyncSession` object backed by a test database that can be used for testing
     calls to SQLAlchemy.
 
-    Empties tables using `TRUNCATE` between tests.
+    Tables are emptied by the :func:`pg` fixture before each test.
 
     """
     session = AsyncSession(bind=pg)
 
     yield session
 
-    async with pg.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
     await session.close()
@@ -26,6 +26,12 @@ async def test_settings(dbi):
     await dbi.settings.insert_one(settings)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def settings():
+    """
+    Default application settings shared by the whole session.
+
+    Do not mutate this object. Use :func:`dataclasses.replace` to derive modified settings.
+
+    """
     return Settings()
@@ -56,11 +56,23 @@ def create_user(static_time):
     return func
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def all_permissions():
+    """
+    A permissions dict with every permission enabled.
+
+    The dict is shared by every test in the session. Copy it before making changes.
+
+    """
     return {permission: True for permission in PERMISSIONS}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def no_permissions():
+    """
+    A permissions dict with every permission disabled.
+
+    The dict is shared by every test in the session. Copy it before making changes.
+
+    """
     return {permission: False for permission in PERMISSIONS}
@@ -105,13 +105,13 @@ async def test_update_permissions(error, spawn_client, no_permissions, resp_is):
 
     assert resp.status == 200
 
-    no_permissions["create_sample"] = True
+    permissions = {**no_permissions, "create_sample": True}
 
-    assert await resp.json() == {"id": "test", "permissions": no_permissions}
+    assert await resp.json() == {"id": "test", "permissions": permissions}
 
     assert await client.db.groups.find_one("test") == {
         "_id": "test",
-        "permissions": no_permissions,
+        "permissions": permissions,
     }
 
 
@@ -17,7 +17,7 @@ from virtool.history.utils import (
     write_diff_file,
 )
 
-TEST_DIFF_PATH = Path.cwd() / "tests" / "test_files" / "diff.json"
+TEST_DIFF_PATH = Path(__file__).parent.parent / "test_files" / "diff.json"
 
 
 def test_calculate_diff(test_otu_edit):
@@ -16,7 +16,7 @@ from virtool.hmm.db import (
     generate_annotations_json_file,
 )
 
-JSON_RESULT_PATH = Path.cwd() / "tests" / "test_files" / "nuvs" / "results.json"
+JSON_RESULT_PATH = Path(__file__).parent.parent / "test_files" / "nuvs" / "results.json"
 
 
 async def test_get_hmms_referenced_in_files(dbi, mocker, tmp_path, config):
@@ -17,7 +17,9 @@ from virtool.indexes.models import IndexFile
 from virtool.indexes.utils import check_index_file_type
 from virtool.jobs.client import DummyJobsClient
 
-OTUS_JSON_PATH = Path.cwd() / "tests/test_files/index/otus.json.gz"
+INDEX_FILES_PATH = Path(__file__).parent.parent / "test_files" / "index"
+
+OTUS_JSON_PATH = INDEX_FILES_PATH / "otus.json.gz"
 
 
 async def test_find(mocker, snapshot, fake, spawn_client, static_time):
@@ -348,13 +350,12 @@ async def test_delete_index(spawn_job_client, error):
 
 
 @pytest.mark.parametrize("error", [None, "409", "404_index", "404_file"])
+@pytest.mark.postgres
 async def test_upload(
     error, tmp_path, fake, spawn_job_client, snapshot, static_time, resp_is, pg_session
 ):
     client = await spawn_job_client(authorize=True)
-    path = Path.cwd() / "tests" / "test_files" / "index" / "reference.1.bt2"
-
-    files = {"file": open(path, "rb")}
+    files = {"file": open(INDEX_FILES_PATH / "reference.1.bt2", "rb")}
 
     client.app["config"].data_path = tmp_path
 
@@ -459,7 +460,7 @@ async def test_download(status, spawn_job_client, tmp_path):
         {"_id": "test_index", "reference": {"id": "test_reference"}}
     )
 
-    path = Path.cwd() / "tests" / "test_files" / "index" / "reference.1.bt2"
+    path = INDEX_FILES_PATH / "reference.1.bt2"
     target_path = tmp_path / "references" / "test_reference" / "test_index"
     target_path.mkdir(parents=True)
     shutil.copyfile(path, target_path / "reference.1.bt2")
@@ -1,10 +1,14 @@
+import io
 import os
 from pathlib import Path
+from urllib.parse import urlencode
 
 import arrow
 import pytest
+from aiohttp import FormData
 from aiohttp.test_utils import make_mocked_coro
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 import virtool.caches.db
 import virtool.pg.utils
@@ -18,14 +22,62 @@ from virtool.pg.utils import get_row_by_id
 from virtool.samples.db import check_name
 from virtool.samples.files import create_reads_file
 from virtool.samples.models import SampleArtifact, SampleReads
+from virtool.settings.db import Settings
 from virtool.uploads.models import Upload
 
+TEST_FILES_PATH = Path(__file__).resolve().parent.parent / "test_files"
+
+NUVS_READS_1_FQ = (TEST_FILES_PATH / "nuvs" / "reads_1.fq").read_bytes()
+
+#: Gzipped sample reads files, read once at import and shared by the upload tests.
+SAMPLE_READS = {
+    name: (TEST_FILES_PATH / "samples" / name).read_bytes()
+    for name in ("reads_1.fq.gz", "reads_2.fq.gz")
+}
+
+#: The upload row the sample creation tests create samples from.
+UPLOAD_ROW = {"id": 1, "name": "test.fq.gz", "size": 123456}
+
+#: Fields shared by the sample documents in :func:`test_find`.
+SAMPLE_DEFAULTS = {
+    "all_read": True,
+    "foobar": True,
+    "host": "",
+    "nuvs": False,
+    "pathoscope": False,
+    "ready": True,
+}
+
+
+def create_upload_form(content: bytes, filename: str) -> FormData:
+    """
+    Create multipart form data that uploads ``content`` from memory.
+
+    """
+    data = FormData()
+    data.add_field("file", io.BytesIO(content), filename=filename)
+    return data
+
 
 class MockJobInterface:
     def __init__(self):
         self.enqueue = make_mocked_coro()
 
 
+@pytest.fixture
+def mock_job_interface():
+    return MockJobInterface()
+
+
+@pytest.fixture
+def grant_sample_rights(mocker):
+    """
+    Give the requesting user read and write rights on every sample.
+
+    """
+    mocker.patch("virtool.samples.utils.get_sample_rights", return_value=(True, True))
+
+
 @pytest.mark.parametrize(
     "find,per_page,page,labels",
     [
@@ -42,93 +94,84 @@ class MockJobInterface:
     ],
 )
 async def test_find(
-    find, per_page, page, labels, snapshot, fake, spawn_client, static_time, pg_session
+    find,
+    per_page,
+    page,
+    labels,
+    snapshot,
+    fake_user_pool,
+    seed,
+    spawn_client,
+    static_time,
 ):
-    user_1 = await fake.users.insert()
-    user_2 = await fake.users.insert()
+    user_1, user_2 = fake_user_pool
 
     client = await spawn_client(authorize=True)
 
-    async with pg_session as session:
-        session.add_all(
-            [
-                Label(id=1, name="Bug", color="#a83432", description="This is a bug"),
-                Label(id=2, name="Info", color="#03fc20", description="This is a info"),
-                Label(
-                    id=3,
-                    name="Question",
-                    color="#0d321d",
-                    description="This is a question",
-                ),
+    await seed(
+        collections={
+            "samples": [
+                {
+                    **SAMPLE_DEFAULTS,
+                    "_id": "beb1eb10",
+                    "name": "16GVP042",
+                    "user": {"id": user_1["_id"]},
+                    "isolate": "Thing",
+                    "created_at": arrow.get(static_time.datetime)
+                    .shift(hours=1)
+                    .datetime,
+                    "labels": [1, 2],
+                },
+                {
+                    **SAMPLE_DEFAULTS,
+                    "_id": "72bb8b31",
+                    "name": "16GVP043",
+                    "user": {"id": user_2["_id"]},
+                    "isolate": "Test",
+                    "created_at": arrow.get(static_time.datetime).datetime,
+                    "labels": [1],
+                },
+                {
+                    **SAMPLE_DEFAULTS,
+                    "_id": "cb400e6d",
+                    "name": "16SPP044",
+                    "user": {"id": user_2["_id"]},
+                    "isolate": "",
+                    "created_at": arrow.get(static_time.datetime)
+                    .shift(hours=2)
+                    .datetime,
+                    "labels": [3],
+                },
             ]
-        )
-        await session.commit()
-
-    await client.db.samples.insert_many(
-        [
-            {
-                "user": {"id": user_1["_id"]},
-                "nuvs": False,
-                "host": "",
-                "foobar": True,
-                "isolate": "Thing",
-                "created_at": arrow.get(static_time.datetime).shift(hours=1).datetime,
-                "_id": "beb1eb10",
-                "name": "16GVP042",
-                "pathoscope": False,
-                "all_read": True,
-                "ready": True,
-                "labels": [1, 2],
-            },
-            {
-                "user": {"id": user_2["_id"]},
-                "nuvs": False,
-                "host": "",
-                "foobar": True,
-                "isolate": "Test",
-                "created_at": arrow.get(static_time.datetime).datetime,
-                "_id": "72bb8b31",
-                "name": "16GVP043",
-                "pathoscope": False,
-                "all_read": True,
-                "ready": True,
-                "labels": [1],
-            },
-            {
-                "user": {"id": user_2["_id"]},
-                "nuvs": False,
-                "host": "",
-                "foobar": True,
-                "ready": True,
-                "isolate": "",
-                "created_at": arrow.get(static_time.datetime).shift(hours=2).datetime,
-                "_id": "cb400e6d",
-                "name": "16SPP044",
-                "pathoscope": False,
-                "all_read": True,
-                "labels": [3],
-            },
-        ]
+        },
+        rows={
+            Label: [
+                {
+                    "id": 1,
+                    "name": "Bug",
+                    "color": "#a83432",
+                    "description": "This is a bug",
+                },
+                {
+                    "id": 2,
+                    "name": "Info",
+                    "color": "#03fc20",
+                    "description": "This is a info",
+                },
+                {
+                    "id": 3,
+                    "name": "Question",
+                    "color": "#0d321d",
+                    "description": "This is a question",
+                },
+            ]
+        },
     )
 
-    path = "/samples"
-    query = list()
-
-    if find is not None:
-        query.append(f"find={find}")
-
-    if per_page is not None:
-        query.append(f"per_page={per_page}")
-
-    if page is not None:
-        query.append(f"page={page}")
+    params = {"find": find, "per_page": per_page, "page": page, "label": labels}
+    query = urlencode({k: v for k, v in params.items() if v is not None}, doseq=True)
 
-    if labels is not None:
-        label_query = "&label=".join(str(label) for label in labels)
-        query.append(f"label={label_query}")
-
-    if query:
-        path += "?{}".format("&".join(query))
+    path = "/samples" + (f"?{query}" if query else "")
 
     resp = await client.get(path)
 
@@ -139,58 +182,75 @@ async def test_find(
 @pytest.mark.parametrize("error", [None, "404"])
 @pytest.mark.parametrize("ready", [True, False])
 async def test_get(
-    error, ready, mocker, snapshot, fake, spawn_client, resp_is, static_time, pg_session
+    error,
+    ready,
+    snapshot,
+    fake_user_pool,
+    grant_sample_rights,
+    seed,
+    spawn_client,
+    resp_is,
+    static_time,
 ):
-    mocker.patch("virtool.samples.utils.get_sample_rights", return_value=(True, True))
-
-    user = await fake.users.insert()
+    user = fake_user_pool[0]
 
     client = await spawn_client(authorize=True)
 
     if not error:
-        await client.db.subtraction.insert_many(
-            [{"_id": "foo", "name": "Foo"}, {"_id": "bar", "name": "Bar"}]
-        )
-
-        await client.db.samples.insert_one(
-            {
-                "_id": "test",
-                "name": "Test",
-                "created_at": static_time.datetime,
-                "ready": ready,
-                "files": [
+        await seed(
+            collections={
+                "subtraction": [
+                    {"_id": "foo", "name": "Foo"},
+                    {"_id": "bar", "name": "Bar"},
+                ],
+                "samples": [
                     {
-                        "id": "foo",
-                        "name": "Bar.fq.gz",
-                        "download_url": "/download/samples/files/file_1.fq.gz",
+                        "_id": "test",
+                        "name": "Test",
+                        "created_at": static_time.datetime,
+                        "ready": ready,
+                        "files": [
+                            {
+                                "id": "foo",
+                                "name": "Bar.fq.gz",
+                                "download_url": "/download/samples/files/file_1.fq.gz",
+                            }
+                        ],
+                        "labels": [1],
+                        "subtractions": ["foo", "bar"],
+                        "user": {"id": user["_id"]},
                     }
                 ],
-                "labels": [1],
-                "subtractions": ["foo", "bar"],
-                "user": {"id": user["_id"]},
-            }
-        )
-
-        label = Label(id=1, name="Bug", color="#a83432", description="This is a bug")
-
-        artifact = SampleArtifact(
-            name="reference.fa.gz",
-            sample="test",
-            type="fasta",
-            name_on_disk="reference.fa.gz",
-        )
-
-        reads = SampleReads(
-            name="reads_1.fq.gz", name_on_disk="reads_1.fq.gz", sample="test"
+            },
+            rows={
+                Label: [
+                    {
+                        "id": 1,
+                        "name": "Bug",
+                        "color": "#a83432",
+                        "description": "This is a bug",
+                    }
+                ],
+                SampleArtifact: [
+                    {
+                        "name": "reference.fa.gz",
+                        "sample": "test",
+                        "type": "fasta",
+                        "name_on_disk": "reference.fa.gz",
+                    }
+                ],
+                Upload: [{"name": "test"}],
+                SampleReads: [
+                    {
+                        "name": "reads_1.fq.gz",
+                        "name_on_disk": "reads_1.fq.gz",
+                        "sample": "test",
+                        "upload": 1,
+                    }
+                ],
+            },
         )
 
-        upload = Upload(name="test")
-        upload.reads.append(reads)
-
-        async with pg_session as session:
-            session.add_all([label, artifact, reads, upload])
-            await session.commit()
-
     resp = await client.get("/samples/test")
 
     if error:
@@ -201,46 +261,52 @@ async def test_get(
     assert await resp.json() == snapshot
 
 
-class TestCreate:
-    @pytest.mark.parametrize(
-        "group_setting", ["none", "users_primary_group", "force_choice"]
+#: Complete settings for each group setting tested by :meth:`TestCreate.test`.
+CREATE_SETTINGS = {
+    group_setting: Settings(
+        sample_group=group_setting, sample_all_write=True, sample_group_write=True
     )
+    for group_setting in ("none", "users_primary_group", "force_choice")
+}
+
+
+@pytest.fixture(params=list(CREATE_SETTINGS))
+def create_settings(request) -> Settings:
+    return CREATE_SETTINGS[request.param]
+
+
+@pytest.fixture
+async def subtraction_apple(dbi):
+    await dbi.subtraction.insert_one({"_id": "apple"})
+
+
+class TestCreate:
     async def test(
         self,
-        group_setting,
+        create_settings,
         snapshot,
         mocker,
+        seed,
         spawn_client,
         pg: AsyncEngine,
         static_time,
+        subtraction_apple,
         test_random_alphanumeric,
-        settings,
     ):
         client = await spawn_client(authorize=True, permissions=["create_sample"])
 
-        client.app["settings"] = settings
-        client.app["settings"].sm_proc = 2
-        client.app["settings"].sm_mem = 4
-        client.app["settings"].sample_group = group_setting
-        client.app["settings"].sample_all_write = True
-        client.app["settings"].sample_group_write = True
+        client.app["settings"] = create_settings
 
         data = get_data_from_app(client.app)
         data.jobs._client = DummyJobsClient()
+        m_enqueue = mocker.spy(data.jobs._client, "enqueue")
 
-        await client.db.subtraction.insert_one({"_id": "apple"})
-
-        async with AsyncSession(pg) as session:
-            session.add_all(
-                [
-                    Upload(id=1, name="test.fq.gz", size=123456),
-                    Label(id=1, name="bug", color="#FF0000"),
-                ]
-            )
-            await session.commit()
-
-        await client.db.groups.insert_many(
-            [{"_id": "diagnostics"}, {"_id": "technician"}]
+        await seed(
+            collections={"groups": [{"_id": "diagnostics"}, {"_id": "technician"}]},
+            rows={
+                Upload: [UPLOAD_ROW],
+                Label: [{"id": 1, "name": "bug", "color": "#FF0000"}],
+            },
         )
 
         client.app["jobs"] = mocker.Mock()
@@ -252,7 +318,7 @@ class TestCreate:
             "subtractions": ["apple"],
         }
 
-        if group_setting == "force_choice":
+        if create_settings.sample_group == "force_choice":
             request_data["group"] = "diagnostics"
 
         resp = await client.post("/samples", request_data)
@@ -263,7 +329,7 @@ class TestCreate:
 
         assert await client.db.samples.find_one() == snapshot
 
-        assert data.jobs._client.enqueued == [("create_sample", "u3cuwaoq")]
+        m_enqueue.assert_called_once_with("create_sample", "u3cuwaoq")
 
         async with pg.begin() as conn:
             upload = await get_row_by_id(conn, Upload, 1)
@@ -293,7 +359,9 @@ class TestCreate:
         await resp_is.bad_request(resp, "Sample name is already in use")
 
     @pytest.mark.parametrize("group", ["", "diagnostics", None])
-    async def test_force_choice(self, spawn_client, pg: AsyncEngine, resp_is, group):
+    async def test_force_choice(
+        self, seed, spawn_client, resp_is, group, subtraction_apple
+    ):
         """
         Test that when ``force_choice`` is enabled, a request with no group field passed results in
         an error response, that "" is accepted as a valid user group and that valid user groups are accepted as expected
@@ -304,22 +372,12 @@ class TestCreate:
         client.app["settings"].sample_group = "force_choice"
         client.app["settings"].sample_unique_names = True
 
-        await client.db.subtraction.insert_one(
-            {
-                "_id": "apple",
-            }
+        await seed(
+            collections={"groups": [{"_id": "diagnostics"}]},
+            rows={Upload: [UPLOAD_ROW]},
         )
 
-        upload = Upload(id=1, name="test.fq.gz", size=123456)
-
-        async with AsyncSession(pg) as session:
-            session.add(upload)
-            await session.commit()
-
         request_data = {"name": "Foobar", "files": [1], "subtractions": ["apple"]}
-        await client.db.groups.insert_one(
-            {"_id": "diagnostics"},
-        )
 
         if group is None:
             resp = await client.post("/samples", request_data)
@@ -329,19 +387,13 @@ class TestCreate:
             resp = await client.post("/samples", request_data)
             assert resp.status == 201
 
-    async def test_group_dne(self, spawn_client, pg: AsyncEngine, resp_is):
+    async def test_group_dne(self, seed, spawn_client, resp_is, subtraction_apple):
         client = await spawn_client(authorize=True, permissions=["create_sample"])
 
         client.app["settings"].sample_group = "force_choice"
         client.app["settings"].sample_unique_names = True
 
-        await client.db.subtraction.insert_one({"_id": "apple"})
-
-        upload = Upload(id=1, name="test.fq.gz", size=123456)
-
-        async with AsyncSession(pg) as session:
-            session.add(upload)
-            await session.commit()
+        await seed(rows={Upload: [UPLOAD_ROW]})
 
         resp = await client.post(
             "/samples",
@@ -354,14 +406,10 @@ class TestCreate:
         )
         await resp_is.bad_request(resp, "Group does not exist")
 
-    async def test_subtraction_dne(self, pg: AsyncEngine, spawn_client, resp_is):
+    async def test_subtraction_dne(self, seed, spawn_client, resp_is):
         client = await spawn_client(authorize=True, permissions=["create_sample"])
 
-        upload = Upload(id=1, name="test.fq.gz", size=123456)
-
-        async with AsyncSession(pg) as session:
-            session.add(upload)
-            await session.commit()
+        await seed(rows={Upload: [UPLOAD_ROW]})
 
         resp = await client.post(
             "/samples", {"name": "Foobar", "files": [1], "subtractions": ["apple"]}
@@ -369,7 +417,9 @@ class TestCreate:
         await resp_is.bad_request(resp, "Subtractions do not exist: apple")
 
     @pytest.mark.parametrize("one_exists", [True, False])
-    async def test_file_dne(self, one_exists, spawn_client, pg: AsyncEngine, resp_is):
+    async def test_file_dne(
+        self, one_exists, seed, spawn_client, resp_is, subtraction_apple
+    ):
         """
         Test that a ``404`` is returned if one or more of the file ids passed in ``files`` does not
         exist.
@@ -379,19 +429,8 @@ class TestCreate:
 
         client.app["settings"].sample_unique_names = True
 
-        await client.db.subtraction.insert_one(
-            {
-                "_id": "apple",
-            }
-        )
-
         if one_exists:
-            upload = Upload(id=1, name="test.fq.gz", size=123456)
-
-            async with AsyncSession(pg) as session:
-                session.add(upload)
-
-                await session.commit()
+            await seed(rows={Upload: [UPLOAD_ROW]})
 
         resp = await client.post(
             "/samples", {"name": "Foobar", "files": [1, 2], "subtractions": ["apple"]}
@@ -399,16 +438,24 @@ class TestCreate:
         await resp_is.bad_request(resp, "File does not exist")
 
     @pytest.mark.parametrize("exists", [True, False])
-    async def test_label_dne(self, exists, spawn_client, pg_session, resp_is):
+    async def test_label_dne(self, exists, spawn_client, pg: AsyncEngine, resp_is):
         client = await spawn_client(authorize=True, permissions=["create_sample"])
 
         client.app["settings"].sample_unique_names = True
 
         if exists:
-            label = Label(id=1, name="Orange", color="#FFA500", description="An orange")
-            async with pg_session as session:
-                session.add(label)
-                await session.commit()
+            async with pg.begin() as conn:
+                await conn.execute(
+                    insert(Label),
+                    [
+                        {
+                            "id": 1,
+                            "name": "Orange",
+                            "color": "#FFA500",
+                            "description": "An orange",
+                        }
+                    ],
+                )
 
         resp = await client.post(
             "/samples", {"name": "Foobar", "files": [1], "labels": [1]}
@@ -418,36 +465,40 @@ class TestCreate:
 
 
 class TestEdit:
-    async def test(self, snapshot, fake, spawn_client, pg: AsyncEngine, pg_session):
+    async def test(self, snapshot, fake_user_pool, seed, spawn_client):
         """
         Test that an existing sample can be edited correctly.
 
         """
         client = await spawn_client(authorize=True, administrator=True)
 
-        user = await fake.users.insert()
+        user = fake_user_pool[0]
 
-        await client.db.samples.insert_one(
-            {
-                "_id": "test",
-                "name": "Test",
-                "all_read": True,
-                "all_write": True,
-                "labels": [2, 3],
-                "ready": True,
-                "subtractions": ["apple"],
-                "user": {
-                    "id": user["_id"],
-                },
-            }
+        await seed(
+            collections={
+                "samples": [
+                    {
+                        "_id": "test",
+                        "name": "Test",
+                        "all_read": True,
+                        "all_write": True,
+                        "labels": [2, 3],
+                        "ready": True,
+                        "subtractions": ["apple"],
+                        "user": {
+                            "id": user["_id"],
+                        },
+                    }
+                ],
+                "subtraction": [{"_id": "foo", "name": "Foo"}],
+            },
+            rows={
+                Label: [
+                    {"name": "Bug", "color": "#a83432", "description": "This is a bug"}
+                ]
+            },
         )
 
-        await client.db.subtraction.insert_one({"_id": "foo", "name": "Foo"})
-
-        async with pg_session as session:
-            session.add(Label(name="Bug", color="#a83432", description="This is a bug"))
-            await session.commit()
-
         resp = await client.patch(
             "/samples/test",
             {
@@ -461,16 +512,92 @@ class TestEdit:
         assert resp.status == 200
         assert await resp.json() == snapshot
 
-    @pytest.mark.parametrize("exists", [True, False])
-    async def test_name_exists(self, exists, snapshot, fake, spawn_client, resp_is):
+    @pytest.mark.parametrize(
+        "sample,other_samples,subtractions,rows,data,error",
+        [
+            pytest.param({}, [], [], {}, {"name": "Bar"}, None, id="name"),
+            pytest.param(
+                {},
+                [{"_id": "bar", "name": "Bar", "ready": True, "subtractions": []}],
+                [],
+                {},
+                {"name": "Bar"},
+                "Sample name is already in use",
+                id="name_in_use",
+            ),
+            pytest.param(
+                {"labels": [2, 3]},
+                [],
+                [],
+                {},
+                {"labels": [1]},
+                "Labels do not exist: 1",
+                id="label_dne",
+            ),
+            pytest.param(
+                {"labels": [2, 3]},
+                [],
+                [],
+                {
+                    Label: [
+                        {
+                            "id": 1,
+                            "name": "Bug",
+                            "color": "#a83432",
+                            "description": "This is a bug",
+                        }
+                    ]
+                },
+                {"labels": [1]},
+                None,
+                id="label_exists",
+            ),
+            pytest.param(
+                {"_id": "test", "name": "Test", "subtractions": ["apple"]},
+                [],
+                [{"_id": "foo", "name": "Foo"}],
+                {},
+                {"subtractions": ["foo", "bar"]},
+                "Subtractions do not exist: bar",
+                id="subtraction_dne",
+            ),
+            pytest.param(
+                {"_id": "test", "name": "Test", "subtractions": ["apple"]},
+                [],
+                [{"_id": "foo", "name": "Foo"}, {"_id": "bar", "name": "Bar"}],
+                {},
+                {"subtractions": ["foo", "bar"]},
+                None,
+                id="subtraction_exists",
+            ),
+        ],
+    )
+    async def test_validation(
+        self,
+        sample,
+        other_samples,
+        subtractions,
+        rows,
+        data,
+        error,
+        snapshot,
+        fake_user_pool,
+        seed,
+        spawn_client,
+        resp_is,
+    ):
         """
-        Test that a ``bad_request`` is returned if the sample name passed in ``name``
-        already exists.
+        Test that a ``bad_request`` is returned if the sample name passed in ``name`` is
+        already in use, or if the labels or subtractions passed in ``labels`` or
+        ``subtractions`` do not exist.
+
+        ``sample`` holds overrides for the sample being edited. ``other_samples``,
+        ``subtractions`` and ``rows`` are seeded alongside it.
 
         """
         client = await spawn_client(authorize=True, administrator=True)
 
-        user = await fake.users.insert()
+        user = fake_user_pool[0]
 
         samples = [
             {
@@ -480,119 +607,23 @@ class TestEdit:
                 "all_write": True,
                 "ready": True,
                 "subtractions": [],
-                "user": {
-                    "id": user["_id"],
-                },
-            }
+                **sample,
+            },
+            *other_samples,
         ]
 
-        if exists:
-            samples.append(
-                {
-                    "_id": "bar",
-                    "name": "Bar",
-                    "ready": True,
-                    "subtractions": [],
-                    "user": {
-                        "id": user["_id"],
-                    },
-                }
-            )
-
-        await client.db.samples.insert_many(samples)
-
-        data = {"name": "Bar"}
-
-        resp = await client.patch("/samples/foo", data)
-
-        if exists:
-            await resp_is.bad_request(resp, "Sample name is already in use")
-            return
-
-        assert resp.status == 200
-        snapshot.assert_match(await resp.json())
-
-    @pytest.mark.parametrize("exists", [True, False])
-    async def test_label_exists(
-        self, exists, snapshot, fake, spawn_client, resp_is, pg_session
-    ):
-        """
-        Test that a ``bad_request`` is returned if the label passed in ``labels`` does
-        not exist.
-
-        """
-        client = await spawn_client(authorize=True, administrator=True)
-
-        user = await fake.users.insert()
-
-        await client.db.samples.insert_one(
-            {
-                "_id": "foo",
-                "name": "Foo",
-                "all_read": True,
-                "all_write": True,
-                "subtractions": [],
-                "user": {"id": user["_id"]},
-                "labels": [2, 3],
-                "ready": True,
-            }
-        )
-
-        if exists:
-            async with pg_session as session:
-                session.add(
-                    Label(
-                        id=1, name="Bug", color="#a83432", description="This is a bug"
-                    )
-                )
-                await session.commit()
-
-        resp = await client.patch("/samples/foo", {"labels": [1]})
-
-        if not exists:
-            await resp_is.bad_request(resp, "Labels do not exist: 1")
-            return
-
-        assert resp.status == 200
-        snapshot.assert_match(await resp.json())
-
-    @pytest.mark.parametrize("exists", [True, False])
-    async def test_subtraction_exists(
-        self, exists, fake, snapshot, spawn_client, resp_is
-    ):
-        """
-        Test that a ``bad_request`` is returned if the subtraction passed in ``subtractions`` does not exist.
-
-        """
-        client = await spawn_client(authorize=True, administrator=True)
-
-        user = await fake.users.insert()
-
-        await client.db.samples.insert_one(
-            {
-                "_id": "test",
-                "name": "Test",
-                "all_read": True,
-                "all_write": True,
-                "ready": True,
-                "subtractions": ["apple"],
-                "user": {"id": user["_id"]},
-            }
+        await seed(
+            collections={
+                "samples": [{**s, "user": {"id": user["_id"]}} for s in samples],
+                "subtraction": subtractions,
+            },
+            rows=rows,
         )
 
-        subtractions = [{"_id": "foo", "name": "Foo"}]
-
-        if exists:
-            subtractions.append({"_id": "bar", "name": "Bar"})
-
-        await client.db.subtraction.insert_many(subtractions)
+        resp = await client.patch(f"/samples/{samples[0]['_id']}", data)
 
-        data = {"subtractions": ["foo", "bar"]}
-
-        resp = await client.patch("/samples/test", data)
-
-        if not exists:
-            await resp_is.bad_request(resp, "Subtractions do not exist: bar")
+        if error:
+            await resp_is.bad_request(resp, error)
             return
 
         assert resp.status == 200
@@ -600,12 +631,14 @@ class TestEdit:
 
 
 @pytest.mark.parametrize("field", ["quality", "not_quality"])
-async def test_finalize(field, snapshot, fake, spawn_job_client, resp_is, pg, tmp_path):
+async def test_finalize(
+    field, snapshot, fake_user_pool, spawn_job_client, resp_is, pg, tmp_path
+):
     """
     Test that sample can be finalized using the Jobs API.
 
     """
-    user = await fake.users.insert()
+    user = fake_user_pool[0]
 
     client = await spawn_job_client(authorize=True)
 
@@ -617,25 +650,34 @@ async def test_finalize(field, snapshot, fake, spawn_job_client, resp_is, pg, tm
         {"_id": "test", "ready": True, "user": {"id": user["_id"]}, "subtractions": []}
     )
 
-    async with AsyncSession(pg) as session:
-        upload = Upload(name="test", name_on_disk="test.fq.gz")
-
-        artifact = SampleArtifact(
-            name="reference.fa.gz",
-            sample="test",
-            type="fasta",
-            name_on_disk="reference.fa.gz",
+    async with pg.begin() as conn:
+        await conn.execute(
+            insert(Upload), [{"name": "test", "name_on_disk": "test.fq.gz"}]
         )
 
-        reads = SampleReads(
-            name="reads_1.fq.gz", name_on_disk="reads_1.fq.gz", sample="test"
+        await conn.execute(
+            insert(SampleArtifact),
+            [
+                {
+                    "name": "reference.fa.gz",
+                    "sample": "test",
+                    "type": "fasta",
+                    "name_on_disk": "reference.fa.gz",
+                }
+            ],
         )
 
-        upload.reads.append(reads)
-
-        session.add_all([upload, artifact, reads])
-
-        await session.commit()
+        await conn.execute(
+            insert(SampleReads),
+            [
+                {
+                    "name": "reads_1.fq.gz",
+                    "name_on_disk": "reads_1.fq.gz",
+                    "sample": "test",
+                    "upload": 1,
+                }
+            ],
+        )
 
     resp = await client.patch("/samples/test", json=data)
 
@@ -653,12 +695,16 @@ async def test_finalize(field, snapshot, fake, spawn_job_client, resp_is, pg, tm
     "delete_result,resp_is_attr", [(1, "no_content"), (0, "not_found")]
 )
 async def test_remove(
-    delete_result, resp_is_attr, mocker, spawn_client, resp_is, create_delete_result
+    delete_result,
+    resp_is_attr,
+    mocker,
+    grant_sample_rights,
+    spawn_client,
+    resp_is,
+    create_delete_result,
 ):
     client = await spawn_client(authorize=True)
 
-    mocker.patch("virtool.samples.utils.get_sample_rights", return_value=(True, True))
-
     if resp_is_attr == "no_content":
         await client.db.samples.insert_one(
             {
@@ -689,8 +735,17 @@ async def test_remove(
 
 @pytest.mark.parametrize("ready", [True, False])
 @pytest.mark.parametrize("exists", [True, False])
+@pytest.mark.postgres
 async def test_job_remove(
-    exists, ready, mocker, resp_is, static_time, spawn_job_client, pg, tmp_path
+    exists,
+    ready,
+    mocker,
+    grant_sample_rights,
+    resp_is,
+    static_time,
+    spawn_job_client,
+    pg,
+    tmp_path,
 ):
     """
     Test that a sample can be removed when called using the Jobs API.
@@ -699,8 +754,6 @@ async def test_job_remove(
     client = await spawn_job_client(authorize=True)
     client.app["config"].data_path = tmp_path
 
-    mocker.patch("virtool.samples.utils.get_sample_rights", return_value=(True, True))
-
     if exists:
         file = await virtool.uploads.db.create(pg, "test", "reads", reserved=True)
         await create_reads_file(pg, 0, "test", "test", "test", upload_id=1)
@@ -735,14 +788,24 @@ async def test_job_remove(
 @pytest.mark.parametrize("error", [None, "404"])
 @pytest.mark.parametrize("term", [None, "Baz"])
 async def test_find_analyses(
-    error, term, snapshot, mocker, fake, spawn_client, resp_is, static_time
+    error,
+    term,
+    snapshot,
+    fake_user_pool,
+    grant_sample_rights,
+    seed,
+    spawn_client,
+    resp_is,
+    static_time,
 ):
-    mocker.patch("virtool.samples.utils.get_sample_rights", return_value=(True, True))
-
     client = await spawn_client(authorize=True)
 
+    user_1, user_2 = fake_user_pool
+
+    samples = []
+
     if not error:
-        await client.db.samples.insert_one(
+        samples.append(
             {
                 "_id": "test",
                 "created_at": static_time.datetime,
@@ -752,55 +815,54 @@ async def test_find_analyses(
             }
         )
 
-    user_1 = await fake.users.insert()
-    user_2 = await fake.users.insert()
-
-    await client.db.subtraction.insert_one(
-        {"_id": "foo", "name": "Malus domestica", "nickname": "Apple"}
-    )
-
-    await client.db.analyses.insert_many(
-        [
-            {
-                "_id": "test_1",
-                "workflow": "pathoscope_bowtie",
-                "created_at": static_time.datetime,
-                "ready": True,
-                "job": {"id": "test"},
-                "index": {"version": 2, "id": "foo"},
-                "reference": {"id": "baz", "name": "Baz"},
-                "sample": {"id": "test"},
-                "subtractions": [],
-                "user": {"id": user_1["_id"]},
-                "foobar": True,
-            },
-            {
-                "_id": "test_2",
-                "workflow": "pathoscope_bowtie",
-                "created_at": static_time.datetime,
-                "ready": True,
-                "job": {"id": "test"},
-                "index": {"version": 2, "id": "foo"},
-                "user": {"id": user_1["_id"]},
-                "reference": {"id": "baz", "name": "Baz"},
-                "sample": {"id": "test"},
-                "subtractions": ["foo"],
-                "foobar": True,
-            },
-            {
-                "_id": "test_3",
-                "workflow": "pathoscope_bowtie",
-                "created_at": static_time.datetime,
-                "ready": True,
-                "job": {"id": "test"},
-                "index": {"version": 2, "id": "foo"},
-                "reference": {"id": "foo", "name": "Foo"},
-                "sample": {"id": "test"},
-                "subtractions": ["foo"],
-                "user": {"id": user_2["_id"]},
-                "foobar": False,
-            },
-        ]
+    await seed(
+        collections={
+            "samples": samples,
+            "subtraction": [
+                {"_id": "foo", "name": "Malus domestica", "nickname": "Apple"}
+            ],
+            "analyses": [
+                {
+                    "_id": "test_1",
+                    "workflow": "pathoscope_bowtie",
+                    "created_at": static_time.datetime,
+                    "ready": True,
+                    "job": {"id": "test"},
+                    "index": {"version": 2, "id": "foo"},
+                    "reference": {"id": "baz", "name": "Baz"},
+                    "sample": {"id": "test"},
+                    "subtractions": [],
+                    "user": {"id": user_1["_id"]},
+                    "foobar": True,
+                },
+                {
+                    "_id": "test_2",
+                    "workflow": "pathoscope_bowtie",
+                    "created_at": static_time.datetime,
+                    "ready": True,
+                    "job": {"id": "test"},
+                    "index": {"version": 2, "id": "foo"},
+                    "user": {"id": user_1["_id"]},
+                    "reference": {"id": "baz", "name": "Baz"},
+                    "sample": {"id": "test"},
+                    "subtractions": ["foo"],
+                    "foobar": True,
+                },
+                {
+                    "_id": "test_3",
+                    "workflow": "pathoscope_bowtie",
+                    "created_at": static_time.datetime,
+                    "ready": True,
+                    "job": {"id": "test"},
+                    "index": {"version": 2, "id": "foo"},
+                    "reference": {"id": "foo", "name": "Foo"},
+                    "sample": {"id": "test"},
+                    "subtractions": ["foo"],
+                    "user": {"id": user_2["_id"]},
+                    "foobar": False,
+                },
+            ],
+        }
     )
 
     url = "/samples/test/analyses"
@@ -825,44 +887,46 @@ async def test_find_analyses(
 async def test_analyze(
     error,
     mocker,
+    mock_job_interface,
     snapshot,
     fake,
+    grant_sample_rights,
+    seed,
     spawn_client,
     static_time,
     resp_is,
     test_random_alphanumeric,
 ):
-    mocker.patch("virtool.samples.utils.get_sample_rights", return_value=(True, True))
-
     client = await spawn_client(authorize=True)
-    client.app["jobs"] = MockJobInterface()
+    client.app["jobs"] = mock_job_interface
 
-    if error != "400_reference":
-        await client.db.references.insert_one({"_id": "foo"})
-
-    if error != "400_index":
-        await client.db.indexes.insert_one(
-            {
-                "_id": "test",
-                "reference": {"id": "foo"},
-                "ready": error != "400_ready_index",
-            }
-        )
-
-    if error != "400_subtraction":
-        await client.db.subtraction.insert_one({"_id": "bar"})
-
-    if error != "404":
-        await client.db.samples.insert_one(
-            {
-                "_id": "test",
-                "name": "Test",
-                "created_at": static_time.datetime,
-                "all_read": True,
-                "all_write": True,
-                "ready": True,
-            }
-        )
+    await seed(
+        collections={
+            "references": [{"_id": "foo"}] if error != "400_reference" else [],
+            "indexes": [
+                {
+                    "_id": "test",
+                    "reference": {"id": "foo"},
+                    "ready": error != "400_ready_index",
+                }
+            ]
+            if error != "400_index"
+            else [],
+            "subtraction": [{"_id": "bar"}] if error != "400_subtraction" else [],
+            "samples": [
+                {
+                    "_id": "test",
+                    "name": "Test",
+                    "created_at": static_time.datetime,
+                    "all_read": True,
+                    "all_write": True,
+                    "ready": True,
+                }
+            ]
+            if error != "404"
+            else [],
+        }
+    )
 
     m_create = mocker.patch(
         "virtool.analyses.db.create",
@@ -955,6 +1019,7 @@ async def test_cache_job_remove(exists, ready, tmp_path, spawn_job_client, resp_
 
 
 @pytest.mark.parametrize("error", [None, 400, 409])
+@pytest.mark.postgres
 async def test_upload_artifact(
     error, snapshot, spawn_job_client, static_time, resp_is, tmp_path
 ):
@@ -962,8 +1027,6 @@ async def test_upload_artifact(
     Test that new artifacts can be uploaded after sample creation using the Jobs API.
 
     """
-    path = Path.cwd() / "tests" / "test_files" / "nuvs" / "reads_1.fq"
-
     client = await spawn_job_client(authorize=True)
 
     client.app["config"].data_path = tmp_path
@@ -978,16 +1041,15 @@ async def test_upload_artifact(
 
     artifact_type = "fastq" if error != 400 else "foo"
 
-    data = {"file": open(path, "rb")}
-
     resp = await client.post(
-        f"/samples/test/artifacts?name=small.fq&type={artifact_type}", data=data
+        f"/samples/test/artifacts?name=small.fq&type={artifact_type}",
+        data=create_upload_form(NUVS_READS_1_FQ, "reads_1.fq"),
     )
 
     if error == 409:
         resp_2 = await client.post(
             f"/samples/test/artifacts?name=small.fq&type={artifact_type}",
-            data={**data, "file": open(path, "rb")},
+            data=create_upload_form(NUVS_READS_1_FQ, "reads_1.fq"),
         )
 
         await resp_is.conflict(
@@ -1004,10 +1066,10 @@ async def test_upload_artifact(
 
 class TestUploadReads:
     @pytest.mark.parametrize("compressed", [True, False])
+    @pytest.mark.postgres
     async def test_upload_reads(
         self,
         compressed,
-        mocker,
         snapshot,
         spawn_job_client,
         static_time,
@@ -1019,9 +1081,10 @@ class TestUploadReads:
         Test that new sample reads can be uploaded using the Jobs API.
 
         """
-        path = Path.cwd() / "tests" / "test_files" / "samples"
-
-        data = {"file": open(path / "reads_1.fq.gz", "rb")}
+        if compressed:
+            data = create_upload_form(SAMPLE_READS["reads_1.fq.gz"], "reads_1.fq.gz")
+        else:
+            data = create_upload_form(b"not gzipped\n" * 1024, "reads_1.fq.gz")
 
         client = await spawn_job_client(authorize=True)
 
@@ -1036,12 +1099,6 @@ class TestUploadReads:
 
         await virtool.uploads.db.create(pg, "test", "reads")
 
-        if not compressed:
-            mocker.patch(
-                "virtool.uploads.utils.naive_writer",
-                side_effect=OSError("Not a gzipped file"),
-            )
-
         resp = await client.put("/samples/test/reads/reads_1.fq.gz?upload=1", data=data)
 
         if compressed:
@@ -1059,9 +1116,7 @@ class TestUploadReads:
         conflicts are properly handled.
 
         """
-        path = Path.cwd() / "tests" / "test_files" / "samples"
-
-        data = {"file": open(path / "reads_1.fq.gz", "rb")}
+        data = create_upload_form(SAMPLE_READS["reads_1.fq.gz"], "reads_1.fq.gz")
 
         client = await spawn_job_client(authorize=True)
 
@@ -1077,11 +1132,11 @@ class TestUploadReads:
 
         resp = await client.put("/samples/test/reads/reads_1.fq.gz", data=data)
 
-        data["file"] = open(path / "reads_2.fq.gz", "rb")
+        data = create_upload_form(SAMPLE_READS["reads_2.fq.gz"], "reads_2.fq.gz")
         resp_2 = await client.put("/samples/test/reads/reads_2.fq.gz", data=data)
 
         if conflict:
-            data["file"] = open(path / "reads_2.fq.gz", "rb")
+            data = create_upload_form(SAMPLE_READS["reads_2.fq.gz"], "reads_2.fq.gz")
             resp_3 = await client.put("/samples/test/reads/reads_2.fq.gz", data=data)
 
             await resp_is.conflict(
@@ -1119,7 +1174,7 @@ async def test_get_cache(error, snapshot, spawn_job_client, resp_is, static_time
 @pytest.mark.parametrize("suffix", ["1", "2"])
 @pytest.mark.parametrize("error", [None, "404_sample", "404_reads", "404_file"])
 async def test_download_reads(
-    suffix, error, tmp_path, spawn_client, spawn_job_client, pg
+    suffix, error, tmp_path, seed, spawn_client, spawn_job_client
 ):
     client = await spawn_client(authorize=True)
     job_client = await spawn_job_client(authorize=True)
@@ -1134,20 +1189,18 @@ async def test_download_reads(
         path.mkdir(parents=True)
         path.joinpath(file_name).write_text("test")
 
-    if error != "404_sample":
-        await client.db.samples.insert_one(
-            {
-                "_id": "foo",
-                "ready": True,
-            }
-        )
-
-    if error != "404_reads":
-        async with AsyncSession(pg) as session:
-            session.add(
-                SampleReads(id=1, sample="foo", name=file_name, name_on_disk=file_name)
-            )
-            await session.commit()
+    await seed(
+        collections={
+            "samples": [{"_id": "foo", "ready": True}] if error != "404_sample" else []
+        },
+        rows={
+            SampleReads: [
+                {"id": 1, "sample": "foo", "name": file_name, "name_on_disk": file_name}
+            ]
+        }
+        if error != "404_reads"
+        else None,
+    )
 
     resp = await client.get(f"/samples/foo/reads/{file_name}")
     job_resp = await job_client.get(f"/samples/foo/reads/{file_name}")
@@ -1167,7 +1220,7 @@ async def test_download_reads(
 
 
 @pytest.mark.parametrize("error", [None, "404_sample", "404_artifact", "404_file"])
-async def test_download_artifact(error, tmp_path, spawn_job_client, pg):
+async def test_download_artifact(error, tmp_path, seed, spawn_job_client):
     client = await spawn_job_client(authorize=True)
 
     client.app["config"].data_path = tmp_path
@@ -1177,27 +1230,24 @@ async def test_download_artifact(error, tmp_path, spawn_job_client, pg):
         path.mkdir(parents=True)
         path.joinpath("fastqc.txt").write_text("test")
 
-    if error != "404_sample":
-        await client.db.samples.insert_one(
-            {
-                "_id": "foo",
-                "ready": True,
-            }
-        )
-
-    if error != "404_artifact":
-        async with AsyncSession(pg) as session:
-            session.add(
-                SampleArtifact(
-                    id=1,
-                    sample="foo",
-                    name="fastqc.txt",
-                    name_on_disk="fastqc.txt",
-                    type="fastq",
-                )
-            )
-
-            await session.commit()
+    await seed(
+        collections={
+            "samples": [{"_id": "foo", "ready": True}] if error != "404_sample" else []
+        },
+        rows={
+            SampleArtifact: [
+                {
+                    "id": 1,
+                    "sample": "foo",
+                    "name": "fastqc.txt",
+                    "name_on_disk": "fastqc.txt",
+                    "type": "fastq",
+                }
+            ]
+        }
+        if error != "404_artifact"
+        else None,
+    )
 
     resp = await client.get("/samples/foo/artifacts/fastqc.txt")
 
@@ -1274,6 +1324,7 @@ class TestCreateCache:
 
 
 @pytest.mark.parametrize("error", [None, 400, 409])
+@pytest.mark.postgres
 async def test_upload_artifact_cache(
     error, resp_is, snapshot, static_time, spawn_job_client, tmp_path
 ):
@@ -1281,10 +1332,9 @@ async def test_upload_artifact_cache(
     Test that a new artifact cache can be uploaded after sample creation using the Jobs API.
 
     """
-    path = Path.cwd() / "tests" / "test_files" / "nuvs" / "reads_1.fq"
     artifact_type = "fastq" if error != 400 else "foo"
 
-    data = {"file": open(path, "rb")}
+    data = create_upload_form(NUVS_READS_1_FQ, "reads_1.fq")
 
     client = await spawn_job_client(authorize=True)
 
@@ -1313,7 +1363,7 @@ async def test_upload_artifact_cache(
     )
 
     if error == 409:
-        data["file"] = open(path, "rb")
+        data = create_upload_form(NUVS_READS_1_FQ, "reads_1.fq")
         resp_2 = await client.post(
             f"/samples/test/caches/aodp-abcdefgh/artifacts?name=small.fq&type={artifact_type}",
             data=data,
@@ -1339,9 +1389,7 @@ async def test_upload_reads_cache(
     Test that sample reads' files cache can be uploaded using the Jobs API.
 
     """
-    path = Path.cwd() / "tests" / "test_files" / "samples"
-
-    data = {"file": open(path / "reads_1.fq.gz", "rb")}
+    data = create_upload_form(SAMPLE_READS["reads_1.fq.gz"], "reads_1.fq.gz")
 
     client = await spawn_job_client(authorize=True)
 
@@ -1366,7 +1414,7 @@ async def test_upload_reads_cache(
     assert resp.status == 201
 
     if paired:
-        data["file"] = open(path / "reads_2.fq.gz", "rb")
+        data = create_upload_form(SAMPLE_READS["reads_2.fq.gz"], "reads_2.fq.gz")
 
         resp = await client.put(
             "/samples/test/caches/aodp-abcdefgh/reads/reads_2.fq.gz", data=data
@@ -1384,7 +1432,7 @@ async def test_upload_reads_cache(
 @pytest.mark.parametrize(
     "error", [None, "404_sample", "404_reads", "404_file", "404_cache"]
 )
-async def test_download_reads_cache(error, spawn_job_client, pg, tmp_path):
+async def test_download_reads_cache(error, seed, spawn_job_client, tmp_path):
     """
     Test that a sample reads cache can be downloaded using the Jobs API.
 
@@ -1401,28 +1449,27 @@ async def test_download_reads_cache(error, spawn_job_client, pg, tmp_path):
         path.mkdir(parents=True)
         path.joinpath(filename).write_text("test")
 
-    if error != "404_sample":
-        await client.db.samples.insert_one(
-            {
-                "_id": "foo",
-                "ready": True,
-            }
-        )
-
-    if error != "404_cache":
-        await client.db.caches.insert_one({"key": key, "sample": {"id": "test"}})
-    if error != "404_reads":
-        sample_reads_cache = SampleReadsCache(
-            id=1,
-            sample="foo",
-            name=filename,
-            name_on_disk=filename,
-            key="aodp-abcdefgh",
-        )
-
-        async with AsyncSession(pg) as session:
-            session.add(sample_reads_cache)
-            await session.commit()
+    await seed(
+        collections={
+            "samples": [{"_id": "foo", "ready": True}] if error != "404_sample" else [],
+            "caches": [{"key": key, "sample": {"id": "test"}}]
+            if error != "404_cache"
+            else [],
+        },
+        rows={
+            SampleReadsCache: [
+                {
+                    "id": 1,
+                    "sample": "foo",
+                    "name": filename,
+                    "name_on_disk": filename,
+                    "key": key,
+                }
+            ]
+        }
+        if error != "404_reads"
+        else None,
+    )
 
     resp = await client.get(f"/samples/foo/caches/{key}/reads/{filename}")
 
@@ -1438,9 +1485,7 @@ async def test_download_reads_cache(error, spawn_job_client, pg, tmp_path):
 @pytest.mark.parametrize(
     "error", [None, "404_sample", "404_artifact", "404_file", "404_cache"]
 )
-async def test_download_artifact_cache(
-    error, spawn_job_client, pg: AsyncEngine, tmp_path
-):
+async def test_download_artifact_cache(error, seed, spawn_job_client, tmp_path):
     """
     Test that a sample artifact cache can be downloaded using the Jobs API.
 
@@ -1457,31 +1502,28 @@ async def test_download_artifact_cache(
         path.mkdir(parents=True)
         path.joinpath(name_on_disk).write_text("text")
 
-    if error != "404_sample":
-        await client.db.samples.insert_one(
-            {
-                "_id": "foo",
-                "ready": True,
-            }
-        )
-
-    if error != "404_artifact":
-        sample_artfact_cache = SampleArtifactCache(
-            id=1,
-            sample="foo",
-            name=name,
-            name_on_disk=name_on_disk,
-            type="fastq",
-            key="aodp-abcdefgh",
-        )
-
-        async with AsyncSession(pg) as session:
-            session.add(sample_artfact_cache)
-
-            await session.commit()
-
-    if error != "404_cache":
-        await client.db.caches.insert_one({"key": key, "sample": {"id": "test"}})
+    await seed(
+        collections={
+            "samples": [{"_id": "foo", "ready": True}] if error != "404_sample" else [],
+            "caches": [{"key": key, "sample": {"id": "test"}}]
+            if error != "404_cache"
+            else [],
+        },
+        rows={
+            SampleArtifactCache: [
+                {
+                    "id": 1,
+                    "sample": "foo",
+                    "name": name,
+                    "name_on_disk": name_on_disk,
+                    "type": "fastq",
+                    "key": key,
+                }
+            ]
+        }
+        if error != "404_artifact"
+        else None,
+    )
 
     resp = await client.get(f"/samples/foo/caches/{key}/artifacts/{name}")
     expected_path = client.app["config"].data_path / "caches" / key / name_on_disk
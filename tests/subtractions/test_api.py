@@ -37,6 +37,7 @@ async def test_edit(data, has_user, mocker, snapshot, fake, spawn_client):
 
 
 @pytest.mark.parametrize("error", [None, "404_name", "404", "409"])
+@pytest.mark.postgres
 async def test_upload(error, tmp_path, spawn_job_client, snapshot, resp_is, pg_session):
     client = await spawn_job_client(authorize=True)
     test_dir = tmp_path / "files"
@@ -9,6 +9,8 @@ import arrow
 import pytest
 import virtool.utils
 
+TEST_FILES_PATH = Path(__file__).parent / "test_files"
+
 
 @pytest.fixture(scope="session")
 def alphanumeric():
@@ -44,9 +46,7 @@ def test_generate_key(mocker):
 def test_decompress_tgz(tmp_path):
     path = tmp_path
 
-    src_path = Path.cwd() / "tests" / "test_files" / "virtool.tar.gz"
-
-    shutil.copy(src_path, path)
+    shutil.copy(TEST_FILES_PATH / "virtool.tar.gz", path)
 
     virtool.utils.decompress_tgz(path / "virtool.tar.gz", path / "de")
 
@@ -4,18 +4,19 @@ from pathlib import Path
 import pytest
 from virtool.uploads.models import Upload, UploadType
 
+TEST_FQ_PATH = Path(__file__).parent.parent / "test_files" / "test.fq.gz"
+
 
 @pytest.fixture
 def files(tmp_path):
     (tmp_path / "files").mkdir()
 
-    path = Path.cwd() / "tests" / "test_files" / "test.fq.gz"
-
-    files = {"file": open(path, "rb")}
+    files = {"file": open(TEST_FQ_PATH, "rb")}
 
     return files
 
 
+@pytest.mark.postgres
 class TestUpload:
     @pytest.mark.parametrize("upload_type", UploadType.to_list())
     async def test(
@@ -92,7 +93,68 @@ class TestFind:
         assert resp.status == 200
         assert await resp.json() == snapshot
 
+    @pytest.mark.parametrize(
+        "query,expected,next_cursor",
+        [
+            ("per_page=2", [1, 2], 2),
+            ("per_page=3", [1, 2, 3], None),
+            ("after=1", [2, 3], None),
+            ("after=1&per_page=1", [2], 2),
+        ],
+    )
+    async def test_paged(
+        self, query, expected, next_cursor, spawn_client, test_uploads
+    ):
+        """
+        Test `GET /uploads` to assure that it pages through uploads using `after` and
+        `per_page`, and points to the next page with `next_cursor`.
+
+        """
+        client = await spawn_client(authorize=True, administrator=True)
+
+        resp = await client.get(f"/uploads?{query}")
+
+        assert resp.status == 200
+
+        body = await resp.json()
+
+        assert [upload["id"] for upload in body["documents"]] == expected
+        assert body["next_cursor"] == next_cursor
+
+    @pytest.mark.parametrize(
+        "query,errors",
+        [
+            ("per_page=0", {"per_page": ["min value is 1"]}),
+            ("per_page=-1", {"per_page": ["min value is 1"]}),
+            ("per_page=101", {"per_page": ["max value is 100"]}),
+            (
+                "per_page=a",
+                {
+                    "per_page": [
+                        "field 'per_page' cannot be coerced: invalid literal for int() "
+                        "with base 10: 'a'",
+                        "must be of integer type",
+                    ]
+                },
+            ),
+            ("after=0", {"after": ["min value is 1"]}),
+        ],
+    )
+    async def test_invalid_query(
+        self, query, errors, resp_is, spawn_client, test_uploads
+    ):
+        """
+        Test `GET /uploads` to assure that it rejects invalid paging parameters.
+
+        """
+        client = await spawn_client(authorize=True, administrator=True)
+
+        resp = await client.get(f"/uploads?{query}")
+
+        await resp_is.invalid_query(resp, errors)
+
 
+@pytest.mark.postgres
 class TestGet:
     @pytest.mark.parametrize("exists", [True, False])
     async def test(self, exists, files, resp_is, spawn_client, tmp_path):
@@ -135,6 +197,7 @@ class TestGet:
         assert resp.status == 404
 
 
+@pytest.mark.postgres
 class TestDelete:
     async def test(self, files, spawn_client, tmp_path, resp_is):
         """
@@ -1,6 +1,9 @@
 import pytest
+from sqlalchemy import select
 
 import virtool.uploads.db
+from virtool.samples.models import SampleReads
+from virtool.uploads.models import Upload
 
 import asyncio
 
@@ -21,3 +24,44 @@ async def test_release(spawn_client, pg, test_uploads, to_release):
             False,
             False,
         )
+
+
+@pytest.mark.parametrize(
+    "after_id,limit,expected",
+    [(None, None, [1, 2, 3]), (None, 2, [1, 2]), (2, None, [3]), (1, 1, [2])],
+)
+async def test_find_paged(after_id, limit, expected, pg, test_uploads):
+    uploads = await virtool.uploads.db.find(pg, after_id=after_id, limit=limit)
+
+    assert [upload["id"] for upload in uploads] == expected
+
+
+@pytest.mark.postgres
+async def test_delete_row(pg, seed):
+    await seed(
+        rows={
+            Upload: [{"id": 1, "name": "test.fq.gz", "name_on_disk": "1-test.fq.gz"}],
+            SampleReads: [
+                {
+                    "id": 1,
+                    "sample": "foo",
+                    "name": "reads_1.fq.gz",
+                    "name_on_disk": "reads_1.fq.gz",
+                    "upload": 1,
+                }
+            ],
+        }
+    )
+
+    upload = await virtool.uploads.db.delete_row(pg, 1)
+
+    assert upload["removed"] is True
+    assert upload["removed_at"] is not None
+
+    async with pg.connect() as conn:
+        reads_upload = (
+            await conn.execute(select(SampleReads.upload).where(SampleReads.id == 1))
+        ).scalar()
+
+    assert reads_upload is None
+    assert await virtool.uploads.db.delete_row(pg, 1) is None
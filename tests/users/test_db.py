@@ -6,6 +6,7 @@ from aiohttp.test_utils import make_mocked_coro
 import virtool.errors
 from virtool.db.transforms import apply_transforms
 from virtool.users.db import (
+    HANDLE_CANDIDATES,
     AttachUserTransform,
     B2CUserAttributes,
     compose_force_reset_update,
@@ -23,6 +24,15 @@ from virtool.users.utils import hash_password
 from virtool.utils import random_alphanumeric
 
 
+@pytest.fixture(scope="session")
+def foobar_hash():
+    """
+    A bcrypt hash of the password `foobar`. Hashing is deliberately slow, so only do it once.
+
+    """
+    return hash_password("foobar")
+
+
 @pytest.mark.parametrize("multiple", [True, False])
 async def test_attach_user_transform(multiple, snapshot, dbi, fake):
     user_1 = await fake.users.insert()
@@ -237,7 +247,9 @@ async def test_edit(
     ],
 )
 @pytest.mark.parametrize("legacy", [True, False])
-async def test_validate_credentials(legacy, user_id, password, result, dbi):
+async def test_validate_credentials(
+    legacy, user_id, password, result, dbi, foobar_hash
+):
     """
     Test that valid, bcrypt-based credentials work.
 
@@ -256,7 +268,7 @@ async def test_validate_credentials(legacy, user_id, password, result, dbi):
             }
         )
     else:
-        document["password"] = hash_password("foobar")
+        document["password"] = foobar_hash
 
     await dbi.users.insert_one(document)
 
@@ -278,10 +290,10 @@ async def test_update_sessions_and_keys(
     Sessions should be changed to match the user account permissions.
 
     """
-    permissions = dict(no_permissions if elevate else all_permissions)
+    permissions = no_permissions if elevate else all_permissions
 
     if missing and not elevate:
-        permissions.update({"create_sample": False, "upload_file": False})
+        permissions = {**permissions, "create_sample": False, "upload_file": False}
 
     await dbi.keys.insert_one(
         {
@@ -315,10 +327,13 @@ async def test_update_sessions_and_keys(
 
 async def test_generate_handle(mocker, dbi):
     """
-    Test that generate_handle generates new handles until it generates one that doesn't already exist in the user
-    collection
+    Test that generate_handle generates new batches of handles until it generates one that doesn't
+    already exist in the user collection
     """
-    mocker.patch("random.randint", side_effect=[1, 1, 1, 2])
+    mocker.patch(
+        "random.randint",
+        side_effect=[1] * HANDLE_CANDIDATES + [1, 2] + [3] * (HANDLE_CANDIDATES - 2),
+    )
 
     await dbi.users.insert_one({"_id": "abc123", "handle": "foo-bar-1"})
 
@@ -25,6 +25,21 @@ def test_check_legacy_password(password, salt, result):
     )
 
 
+def test_check_legacy_password_bcrypt_hash():
+    """
+    Test that a bcrypt hash left alongside a legacy salt never matches.
+
+    """
+    assert (
+        virtool.users.utils.check_legacy_password(
+            "hello_world",
+            "6rn1x86nnlqfj5bqg1n5qhcd",
+            virtool.users.utils.hash_password("hello_world"),
+        )
+        is False
+    )
+
+
 @pytest.mark.parametrize(
     "password,hashed,result",
     [
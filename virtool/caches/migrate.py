@@ -3,6 +3,7 @@ Operation that should be performed on caches when the application starts.
 
 """
 
+import asyncio
 import os
 
 from virtool.types import App
@@ -33,10 +34,17 @@ async def add_missing_field(app: App):
 
     found_cache_ids = os.listdir(path)
 
-    await db.caches.update_many({}, {"$set": {"missing": False}})
-
-    await db.caches.update_many(
-        {"_id": {"$nin": found_cache_ids}}, {"$set": {"missing": True}}
+    # Split the collection into two disjoint updates so each document is only
+    # written once. Documents that already have the correct value are not matched.
+    await asyncio.gather(
+        db.caches.update_many(
+            {"_id": {"$in": found_cache_ids}, "missing": {"$ne": False}},
+            {"$set": {"missing": False}},
+        ),
+        db.caches.update_many(
+            {"_id": {"$nin": found_cache_ids}, "missing": {"$ne": True}},
+            {"$set": {"missing": True}},
+        ),
     )
 
 
@@ -49,4 +57,8 @@ async def rename_hash_field(app: App):
     """
     db = app["db"]
 
-    await db.caches.update_many({}, {"$rename": {"hash": "key"}})
+    # Only match documents that still have the old field. Once the rename has been applied,
+    # startup neither rewrites caches nor dispatches changes for them.
+    await db.caches.update_many(
+        {"hash": {"$exists": True}}, {"$rename": {"hash": "key"}}
+    )
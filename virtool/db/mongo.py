@@ -1,9 +1,10 @@
+import asyncio
 import sys
 from logging import getLogger
 from typing import Callable, List
 
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from pymongo.errors import ServerSelectionTimeoutError
 from semver import VersionInfo
 
@@ -79,31 +80,50 @@ async def create_indexes(db):
     """
     Create all MongoDB indexes.
 
+    Indexes for each collection are created with a single ``createIndexes`` command and
+    collections are processed concurrently.
+
     :param db: the application database object
 
     """
-    await db.analyses.create_index("sample.id")
-    await db.analyses.create_index([("created_at", DESCENDING)])
-    await db.caches.create_index(
-        [("key", ASCENDING), ("sample.id", ASCENDING)], unique=True
-    )
-    await db.history.create_index("otu.id")
-    await db.history.create_index("index.id")
-    await db.history.create_index("created_at")
-    await db.history.create_index([("otu.name", ASCENDING)])
-    await db.history.create_index([("otu.version", DESCENDING)])
-    await db.indexes.create_index(
-        [("version", ASCENDING), ("reference.id", ASCENDING)],
-        unique=True,
+    await asyncio.gather(
+        db.analyses.create_indexes(
+            [IndexModel("sample.id"), IndexModel([("created_at", DESCENDING)])]
+        ),
+        db.caches.create_indexes(
+            [IndexModel([("key", ASCENDING), ("sample.id", ASCENDING)], unique=True)]
+        ),
+        db.history.create_indexes(
+            [
+                IndexModel("otu.id"),
+                IndexModel("index.id"),
+                IndexModel("created_at"),
+                IndexModel([("otu.name", ASCENDING)]),
+                IndexModel([("otu.version", DESCENDING)]),
+            ]
+        ),
+        db.indexes.create_indexes(
+            [
+                IndexModel(
+                    [("version", ASCENDING), ("reference.id", ASCENDING)], unique=True
+                )
+            ]
+        ),
+        db.keys.create_indexes([IndexModel("id", unique=True), IndexModel("user.id")]),
+        db.otus.create_indexes(
+            [
+                IndexModel([("_id", ASCENDING), ("isolate.id", ASCENDING)]),
+                IndexModel("name"),
+                IndexModel("nickname"),
+                IndexModel("abbreviation"),
+            ]
+        ),
+        db.samples.create_indexes([IndexModel([("created_at", DESCENDING)])]),
+        db.sequences.create_indexes([IndexModel("otu_id"), IndexModel("name")]),
+        db.users.create_indexes(
+            [
+                IndexModel("b2c_oid", unique=True, sparse=True),
+                IndexModel("handle", unique=True, sparse=True),
+            ]
+        ),
     )
-    await db.keys.create_index("id", unique=True)
-    await db.keys.create_index("user.id")
-    await db.otus.create_index([("_id", ASCENDING), ("isolate.id", ASCENDING)])
-    await db.otus.create_index("name")
-    await db.otus.create_index("nickname")
-    await db.otus.create_index("abbreviation")
-    await db.samples.create_index([("created_at", DESCENDING)])
-    await db.sequences.create_index("otu_id")
-    await db.sequences.create_index("name")
-    await db.users.create_index("b2c_oid", unique=True, sparse=True)
-    await db.users.create_index("handle", unique=True, sparse=True)
@@ -1,4 +1,5 @@
 from enum import Enum
+from operator import attrgetter
 
 from sqlalchemy.ext.declarative import as_declarative
 
@@ -12,13 +13,45 @@ class Base:
 
         return f"<{self.__class__.__name__}({params})>"
 
-    def to_dict(self):
-        row = dict()
+    @classmethod
+    def _column_getter(cls):
+        """
+        Return the column names of the model and a function that reads all of them from an
+        instance as a tuple.
+
+        Both are built the first time they are needed for each model.
+
+        """
+        try:
+            return cls.__dict__["_column_getter_cache"]
+        except KeyError:
+            names = tuple(column.name for column in cls.__table__.columns)
+
+            if len(names) == 1:
+                # An attrgetter with a single name returns the bare value, not a tuple.
+                single = attrgetter(names[0])
 
-        for column in self.__table__.columns:
-            value = getattr(self, column.name, None)
+                def getter(obj):
+                    return (single(obj),)
 
-            # Enums cannot serialize to JSON
-            row[column.name] = value if not isinstance(value, Enum) else value.value
+            else:
+                getter = attrgetter(*names)
 
-        return row
+            cls._column_getter_cache = (names, getter)
+
+            return cls._column_getter_cache
+
+    def to_dict(self):
+        names, getter = self._column_getter()
+
+        try:
+            values = getter(self)
+        except AttributeError:
+            # Keep the old behaviour of reporting missing attributes as `None`.
+            values = tuple(getattr(self, name, None) for name in names)
+
+        # Enums cannot serialize to JSON
+        return {
+            name: value if not isinstance(value, Enum) else value.value
+            for name, value in zip(names, values)
+        }
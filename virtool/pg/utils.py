@@ -12,6 +12,10 @@ from virtool.pg.base import Base
 
 logger = logging.getLogger(__name__)
 
+#: The number of prepared statements SQLAlchemy's asyncpg dialect keeps per connection. Raised
+#: from the default of 100 so statements for all of the application's models stay prepared.
+PREPARED_STATEMENT_CACHE_SIZE = 500
+
 
 class SQLEnum(Enum):
     @classmethod
@@ -33,7 +37,11 @@ async def connect(postgres_connection_string: str) -> AsyncEngine:
 
     try:
         pg = create_async_engine(
-            postgres_connection_string, json_serializer=pretty_dumps
+            postgres_connection_string,
+            connect_args={
+                "prepared_statement_cache_size": PREPARED_STATEMENT_CACHE_SIZE
+            },
+            json_serializer=pretty_dumps,
         )
 
         await check_version(pg)
@@ -59,9 +67,40 @@ async def check_version(engine: AsyncEngine):
     logger.info(f"Found PostgreSQL {version}")
 
 
+def row_to_dict(row) -> dict:
+    """
+    Convert a row returned by a Core statement to a dictionary.
+
+    Enum values are converted the same way as in :meth:`~virtool.pg.base.Base.to_dict`.
+
+    :param row: a result row
+    :return: a dictionary representation of the row
+    """
+    return {
+        key: value.value if isinstance(value, Enum) else value
+        for key, value in row._mapping.items()
+    }
+
+
+def _create_all(conn):
+    """
+    Create any missing tables and indexes.
+
+    ``create_all`` only creates indexes along with new tables, so indexes added to a model
+    later are created separately for tables that already exist.
+
+    :param conn: a synchronous connection
+    """
+    Base.metadata.create_all(conn)
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
 async def create_models(engine):
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_all)
 
 
 async def delete_row(pg: AsyncEngine, id_: int, model: Type[Base]):
@@ -952,11 +952,11 @@ async def download_reads(req: aiohttp.web.Request):
     if not os.path.isfile(file_path):
         raise NotFound()
 
-    file_stats = virtool.utils.file_stats(file_path)
-
-    headers = {"Content-Length": file_stats["size"], "Content-Type": "application/gzip"}
-
-    return FileResponse(file_path, chunk_size=1024 * 1024, headers=headers)
+    return FileResponse(
+        file_path,
+        chunk_size=1024 * 1024,
+        headers={"Content-Type": "application/gzip"},
+    )
 
 
 @routes.jobs_api.get("/samples/{sample_id}/artifacts/{filename}")
@@ -993,11 +993,11 @@ async def download_artifact(req: aiohttp.web.Request):
     if not os.path.isfile(file_path):
         raise NotFound()
 
-    file_stats = virtool.utils.file_stats(file_path)
-
-    headers = {"Content-Length": file_stats["size"], "Content-Type": "application/gzip"}
-
-    return FileResponse(file_path, chunk_size=1024 * 1024, headers=headers)
+    return FileResponse(
+        file_path,
+        chunk_size=1024 * 1024,
+        headers={"Content-Type": "application/gzip"},
+    )
 
 
 @routes.jobs_api.get("/samples/{sample_id}/caches/{key}/reads/reads_{suffix}.fq.gz")
@@ -1030,11 +1030,11 @@ async def download_cache_reads(req):
     if not os.path.isfile(file_path):
         raise NotFound()
 
-    file_stats = virtool.utils.file_stats(file_path)
-
-    headers = {"Content-Length": file_stats["size"], "Content-Type": "application/gzip"}
-
-    return FileResponse(file_path, chunk_size=1024 * 1024, headers=headers)
+    return FileResponse(
+        file_path,
+        chunk_size=1024 * 1024,
+        headers={"Content-Type": "application/gzip"},
+    )
 
 
 @routes.jobs_api.get("/samples/{sample_id}/caches/{key}/artifacts/{filename}")
@@ -1074,8 +1074,8 @@ async def download_cache_artifact(req):
     if not file_path.exists():
         raise NotFound()
 
-    file_stats = virtool.utils.file_stats(file_path)
-
-    headers = {"Content-Length": file_stats["size"], "Content-Type": "application/gzip"}
-
-    return FileResponse(file_path, chunk_size=1024 * 1024, headers=headers)
+    return FileResponse(
+        file_path,
+        chunk_size=1024 * 1024,
+        headers={"Content-Type": "application/gzip"},
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy import JSON, Boolean, Column, DateTime, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
 
 from virtool.pg.base import Base
@@ -9,7 +9,7 @@ class Task(Base):
 
     id = Column(Integer, primary_key=True)
     complete = Column(Boolean, default=False)
-    context = Column(JSONB)
+    context = Column(JSONB().with_variant(JSON(), "sqlite"))
     count = Column(Integer, default=0)
     created_at = Column(DateTime, nullable=False)
     error = Column(String)
@@ -4,6 +4,7 @@ from logging import getLogger
 from aiohttp.web_exceptions import HTTPBadRequest
 from aiohttp.web_fileresponse import FileResponse
 from aiohttp.web_response import Response
+from cerberus import Validator
 
 import virtool.uploads.db
 from virtool.api.response import InvalidQuery, NotFound, json_response
@@ -15,6 +16,11 @@ from virtool.users.db import AttachUserTransform
 
 logger = getLogger(__name__)
 
+QUERY_SCHEMA = {
+    "after": {"type": "integer", "coerce": int, "min": 1},
+    "per_page": {"type": "integer", "coerce": int, "min": 1, "max": 100},
+}
+
 routes = Routes()
 
 
@@ -77,13 +83,35 @@ async def find(req):
     user = req.query.get("user")
     upload_type = req.query.get("type")
 
-    uploads = await virtool.uploads.db.find(pg, user, upload_type)
+    v = Validator(QUERY_SCHEMA, allow_unknown=True)
+
+    if not v.validate(dict(req.query)):
+        raise InvalidQuery(v.errors)
+
+    limit = v.document.get("per_page")
+
+    # Paging is opt-in. Without `per_page` every matching upload is returned. Ask for one
+    # extra upload to tell whether there is another page.
+    uploads = await virtool.uploads.db.find(
+        pg,
+        user,
+        upload_type,
+        after_id=v.document.get("after"),
+        limit=None if limit is None else limit + 1,
+    )
+
+    next_cursor = None
+
+    if limit is not None and len(uploads) > limit:
+        uploads = uploads[:limit]
+        next_cursor = uploads[-1]["id"]
 
     return json_response(
         {
             "documents": await apply_transforms(
                 uploads, [AttachUserTransform(req.app["db"])]
-            )
+            ),
+            "next_cursor": next_cursor,
         }
     )
 
@@ -1,11 +1,14 @@
 import logging
 from typing import Dict, List, Optional, Type, Union
 
-from sqlalchemy import select, update
+from sqlalchemy import String, cast, func, insert, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import raiseload
 
 import virtool.utils
 from virtool.pg.base import Base
+from virtool.pg.utils import row_to_dict
+from virtool.samples.models import SampleReads
 from virtool.uploads.models import Upload
 
 logger = logging.getLogger("uploads")
@@ -31,28 +34,36 @@ async def create(
     :param user: The id of the uploading user
     :return: Dictionary representation of new row in the `uploads` SQL table
     """
-    async with AsyncSession(pg) as session:
-        upload = Upload(
-            created_at=virtool.utils.timestamp(),
-            name=name,
-            ready=False,
-            removed=False,
-            reserved=reserved,
-            type=upload_type,
-            user=user,
-        )
-
-        session.add(upload)
-
-        await session.flush()
-
-        upload.name_on_disk = f"{upload.id}-{upload.name}"
-
-        upload = upload.to_dict()
+    # Draw the id once in a CTE so `name_on_disk` can be derived from it in the same
+    # INSERT. The sequence is looked up instead of relying on the name `SERIAL` gives it.
+    next_id = select(
+        func.nextval(func.pg_get_serial_sequence("uploads", "id")).label("id")
+    ).cte("next_id")
+
+    async with AsyncSession(pg, expire_on_commit=False) as session:
+        row = (
+            await session.execute(
+                insert(Upload.__table__)
+                .values(
+                    id=select(next_id.c.id).scalar_subquery(),
+                    created_at=virtool.utils.timestamp(),
+                    name=name,
+                    name_on_disk=select(
+                        cast(next_id.c.id, String) + f"-{name}"
+                    ).scalar_subquery(),
+                    ready=False,
+                    removed=False,
+                    reserved=reserved,
+                    type=upload_type,
+                    user=user,
+                )
+                .returning(*Upload.__table__.columns)
+            )
+        ).first()
 
         await session.commit()
 
-        return upload
+    return row_to_dict(row)
 
 
 async def finalize(pg, size: int, id_: int, model: Type[Base]) -> Optional[dict]:
@@ -67,50 +78,81 @@ async def finalize(pg, size: int, id_: int, model: Type[Base]) -> Optional[dict]
     :param model: model for uploaded file
     :return: Dictionary representation of new row in `table`
     """
-    async with AsyncSession(pg) as session:
-        upload = (await session.execute(select(model).filter_by(id=id_))).scalar()
-
-        if not upload:
-            return None
-
-        upload.size = size
-        upload.uploaded_at = virtool.utils.timestamp()
-        upload.ready = True
-
-        upload = upload.to_dict()
+    columns = model.__table__.columns
+
+    # Not every upload model has `uploaded_at` and `ready` columns.
+    values = {
+        key: value
+        for key, value in (
+            ("size", size),
+            ("uploaded_at", virtool.utils.timestamp()),
+            ("ready", True),
+        )
+        if key in columns
+    }
+
+    async with AsyncSession(pg, expire_on_commit=False) as session:
+        row = (
+            await session.execute(
+                update(model)
+                .where(model.id == id_)
+                .values(**values)
+                .returning(*columns)
+                .execution_options(synchronize_session=False)
+            )
+        ).first()
 
         await session.commit()
 
-    return upload
+    if row is None:
+        return None
 
+    return row_to_dict(row)
 
-async def find(pg, user: str = None, upload_type: str = None) -> List[dict]:
+
+async def find(
+    pg,
+    user: str = None,
+    upload_type: str = None,
+    *,
+    after_id: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> List[dict]:
     """
-    Retrieves a list of `Upload` documents in the `uploads` SQL table.
+    Retrieves a list of `Upload` documents in the `uploads` SQL table ordered by `id`.
 
-    Can be given a list of filters to narrow down results.
+    Can be given a list of filters to narrow down results. Pass the `id` of the last
+    upload in one page as `after_id` to get the next page.
 
     :param pg: PostgreSQL AsyncEngine object
     :param user: User id that corresponds to the user that uploaded the file
     :param upload_type: Type of file that was uploaded
+    :param after_id: Only return uploads with an `id` greater than this one
+    :param limit: The maximum number of uploads to return
     :return: A list of dictionaries that represent each `Upload` document found
     """
     filters = [Upload.removed == False]
-    uploads = list()
 
-    async with AsyncSession(pg) as session:
-        if user:
-            filters.append(Upload.user == user)
+    if user:
+        filters.append(Upload.user == user)
+
+    if upload_type:
+        filters.append(Upload.type == upload_type)
 
-        if upload_type:
-            filters.append(Upload.type == upload_type)
+    if after_id is not None:
+        filters.append(Upload.id > after_id)
 
-        results = await session.execute(select(Upload).filter(*filters))
+    # Select the table columns rather than the model, so no ORM instances are built
+    # and the joined `reads` relationship isn't loaded.
+    query = select(Upload.__table__).where(*filters).order_by(Upload.id)
 
-    for result in results.unique().scalars().all():
-        uploads.append(result.to_dict())
+    if limit is not None:
+        query = query.limit(limit)
 
-    return uploads
+    async with AsyncSession(pg, expire_on_commit=False) as session:
+        results = await session.execute(query)
+
+    return [row_to_dict(row) for row in results]
 
 
 async def get(pg: AsyncEngine, upload_id: int) -> Optional[Upload]:
@@ -121,9 +163,15 @@ async def get(pg: AsyncEngine, upload_id: int) -> Optional[Upload]:
     :param upload_id: Row `id` to retrieve
     :return: An row from the `uploads` table
     """
-    async with AsyncSession(pg) as session:
+    async with AsyncSession(pg, expire_on_commit=False) as session:
         upload = (
-            await session.execute(select(Upload).filter_by(id=upload_id, removed=False))
+            await session.execute(
+                lambda_stmt(
+                    lambda: select(Upload)
+                    .where(Upload.id == upload_id, Upload.removed == False)
+                    .options(raiseload(Upload.reads))
+                )
+            )
         ).scalar()
 
         if not upload:
@@ -146,16 +194,28 @@ async def delete(req, pg: AsyncEngine, upload_id: int) -> Optional[dict]:
     if not upload:
         return None
 
+    # Only remove the file once the row is marked removed, so a failed update never
+    # leaves a live upload without its file.
+    await _remove_file(req.app, upload["name_on_disk"])
+
+    return upload
+
+
+async def _remove_file(app, name_on_disk: str):
+    """
+    Remove the uploaded file stored as `name_on_disk`. Files that are already gone are
+    ignored.
+
+    :param app: the application object
+    :param name_on_disk: the name of the file in the uploads data directory
+    """
     try:
-        await req.app["run_in_thread"](
-            virtool.utils.rm,
-            req.app["config"].data_path / "files" / upload["name_on_disk"],
+        await app["run_in_thread"](
+            virtool.utils.rm, app["config"].data_path / "files" / name_on_disk
         )
     except FileNotFoundError:
         pass
 
-    return upload
-
 
 async def delete_row(pg: AsyncEngine, upload_id: int) -> Optional[dict]:
     """
@@ -167,46 +227,85 @@ async def delete_row(pg: AsyncEngine, upload_id: int) -> Optional[dict]:
     :param upload_id: Row `id` to set attributes for
     :return: A dictionary representation of the deleted row
     """
-    async with AsyncSession(pg) as session:
-        upload = (
-            await session.execute(select(Upload).where(Upload.id == upload_id))
-        ).scalar()
-
-        if not upload or upload.removed:
+    removed_at = virtool.utils.timestamp()
+
+    async with AsyncSession(pg, expire_on_commit=False) as session:
+        row = (
+            await session.execute(
+                lambda_stmt(
+                    lambda: update(Upload)
+                    .where(Upload.id == upload_id, Upload.removed == False)
+                    .values(removed=True, removed_at=removed_at)
+                    .returning(*Upload.__table__.columns)
+                    .execution_options(synchronize_session=False)
+                )
+            )
+        ).first()
+
+        if row is None:
             return None
 
-        upload.reads.clear()
-        upload.removed = True
-        upload.removed_at = virtool.utils.timestamp()
-
-        upload = upload.to_dict()
+        # Detach any sample reads from the upload without loading them first.
+        await session.execute(
+            lambda_stmt(
+                lambda: update(SampleReads)
+                .where(SampleReads.upload == upload_id)
+                .values(upload=None)
+                .execution_options(synchronize_session=False)
+            )
+        )
 
         await session.commit()
 
-    return upload
+    return row_to_dict(row)
 
 
-async def release(pg: AsyncEngine, upload_ids: Union[int, List[int]]):
+async def set_reserved(
+    pg: AsyncEngine,
+    upload_ids: Union[int, List[int]],
+    reserved: bool,
+    session: Optional[AsyncSession] = None,
+):
     """
-    Release the uploads in `upload_ids` by setting the `reserved` field to `False`.
+    Set the `reserved` field for the uploads in `upload_ids`.
+
+    If a `session` is given, the update is made as part of its transaction and the caller
+    is responsible for committing it. This lets several changes share one transaction.
 
     :param pg: PostgreSQL AsyncEngine object
     :param upload_ids: List of row `id`s to set the attribute for
+    :param reserved: the value to set `reserved` to
+    :param session: an optional session to execute the update in
     """
-    if isinstance(upload_ids, int):
-        query = Upload.id == upload_ids
-    else:
-        query = Upload.id.in_(upload_ids)
+    if session is None:
+        async with AsyncSession(pg, expire_on_commit=False) as session:
+            await set_reserved(pg, upload_ids, reserved, session)
+            await session.commit()
 
-    async with AsyncSession(pg) as session:
-        await session.execute(
-            update(Upload)
-            .where(query)
-            .values(reserved=False)
-            .execution_options(synchronize_session="fetch")
+        return
+
+    # Always use an expanding IN, so single ids and lists share one cached statement.
+    if isinstance(upload_ids, int):
+        upload_ids = [upload_ids]
+
+    await session.execute(
+        lambda_stmt(
+            lambda: update(Upload)
+            .where(Upload.id.in_(upload_ids))
+            .values(reserved=reserved)
+            .execution_options(synchronize_session=False)
         )
+    )
 
-        await session.commit()
+
+async def release(pg: AsyncEngine, upload_ids: Union[int, List[int]]):
+    """
+    Release the uploads in `upload_ids` by setting the `reserved` field to `False`.
+
+    :param pg: PostgreSQL AsyncEngine object
+    :param upload_ids: List of row `id`s to set the attribute for
+    """
+    await set_reserved(pg, upload_ids, False)
 
 
 async def reserve(pg: AsyncEngine, upload_ids: Union[int, List[int]]):
@@ -216,16 +315,4 @@ async def reserve(pg: AsyncEngine, upload_ids: Union[int, List[int]]):
     :param pg: PostgreSQL AsyncEngine object
     :param upload_ids: List of row `id`s to set the attribute for
     """
-    if isinstance(upload_ids, int):
-        query = Upload.id == upload_ids
-    else:
-        query = Upload.id.in_(upload_ids)
-
-    async with AsyncSession(pg) as session:
-        await session.execute(
-            update(Upload)
-            .where(query)
-            .values(reserved=True)
-            .execution_options(synchronize_session="fetch")
-        )
-        await session.commit()
+    await set_reserved(pg, upload_ids, True)
@@ -1,4 +1,14 @@
-from sqlalchemy import BigInteger, Boolean, Column, DateTime, Enum, Integer, String
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    String,
+    text,
+)
 from sqlalchemy.orm import relationship
 
 from virtool.pg.base import Base
@@ -24,6 +34,15 @@ class Upload(Base):
     """
 
     __tablename__ = "uploads"
+    __table_args__ = (
+        # Matches the filters used to list uploads, which never include removed ones.
+        Index(
+            "ix_uploads_active_user_type",
+            "user",
+            "type",
+            postgresql_where=text("removed = false"),
+        ),
+    )
 
     id: Column = Column(Integer, primary_key=True)
     created_at: Column = Column(DateTime)
@@ -9,7 +9,12 @@ from cerberus import Validator
 
 logger = getLogger(__name__)
 
-CHUNK_SIZE = 1024 * 1000 * 50
+#: The maximum number of bytes to read from an upload stream at a time. Reads never return more
+#: than the stream has buffered, so larger values only raise the worst-case chunk allocation.
+READ_BUFFER_SIZE = 128 * 1024
+
+#: The number of bytes to accumulate before handing a write off to the file thread.
+WRITE_BUFFER_SIZE = 1024 * 1024
 
 
 def is_gzip_compressed(chunk: bytes):
@@ -61,9 +66,11 @@ async def naive_writer(
     except FileExistsError:
         pass
 
+    buffer = bytearray()
+
     async with aiofiles.open(path, "wb") as f:
         while True:
-            chunk = await file.read_chunk(CHUNK_SIZE)
+            chunk = await file.read_chunk(READ_BUFFER_SIZE)
 
             if not chunk:
                 break
@@ -71,8 +78,14 @@ async def naive_writer(
             if size == 0 and on_first_chunk:
                 on_first_chunk(chunk)
 
-            await f.write(chunk)
-
+            buffer += chunk
             size += len(chunk)
 
+            if len(buffer) >= WRITE_BUFFER_SIZE:
+                await f.write(buffer)
+                buffer.clear()
+
+        if buffer:
+            await f.write(buffer)
+
     return size
@@ -1,3 +1,4 @@
+import asyncio
 import random
 from dataclasses import dataclass
 from logging import Logger
@@ -5,7 +6,7 @@ from typing import Any, Dict, List, Optional, Union
 
 import virtool.utils
 from virtool.db.transforms import AbstractTransform
-from virtool.db.utils import get_non_existent_ids, handle_exists, id_exists, oid_exists
+from virtool.db.utils import get_non_existent_ids, id_exists, oid_exists
 from virtool.errors import DatabaseError
 from virtool.groups.db import get_merged_permissions
 from virtool.types import Document
@@ -35,6 +36,10 @@ ATTACH_PROJECTION = [
     "handle",
 ]
 
+#: The number of candidate handles checked against the database at once in
+#: :func:`generate_handle`.
+HANDLE_CANDIDATES = 8
+
 
 @dataclass
 class B2CUserAttributes:
@@ -240,11 +245,20 @@ async def generate_handle(collection, given_name: str, family_name: str) -> str:
 
     :return: user handle created from B2C user info
     """
-    handle = f"{given_name}-{family_name}-{random.randint(1,100)}"
-    if await handle_exists(collection, handle):
-        return await generate_handle(collection, given_name, family_name)
+    # Check a batch of candidates in one query instead of one query per candidate.
+    while True:
+        candidates = [
+            f"{given_name}-{family_name}-{random.randint(1,100)}"
+            for _ in range(HANDLE_CANDIDATES)
+        ]
+
+        taken = set(
+            await collection.distinct("handle", {"handle": {"$in": candidates}})
+        )
 
-    return handle
+        for handle in candidates:
+            if handle not in taken:
+                return handle
 
 
 async def create(
@@ -332,16 +346,28 @@ async def edit(
     if administrator is not None:
         update["administrator"] = administrator
 
-    update.update(
-        {**compose_force_reset_update(force_reset), **compose_password_update(password)}
-    )
+    # Hashing a new password with bcrypt is slow enough that it shouldn't block the event
+    # loop, so start it in a thread while the independent group checks run.
+    if password is not None:
+        hashing = asyncio.get_running_loop().run_in_executor(
+            None, compose_password_update, password
+        )
 
-    groups_update = await compose_groups_update(db, groups)
-    primary_group_update = await compose_primary_group_update(
-        db, user_id, primary_group
+    groups_update, primary_group_update = await asyncio.gather(
+        compose_groups_update(db, groups),
+        compose_primary_group_update(db, user_id, primary_group),
     )
 
-    update.update({**groups_update, **primary_group_update})
+    password_update = await hashing if password is not None else {}
+
+    update.update(
+        {
+            **compose_force_reset_update(force_reset),
+            **password_update,
+            **groups_update,
+            **primary_group_update,
+        }
+    )
 
     if not update:
         return await db.users.find_one({"_id": user_id})
@@ -381,9 +407,12 @@ async def validate_credentials(db, user_id: str, password: str) -> bool:
     if not document:
         return False
 
-    # Return True if the attempted password matches the stored password.
+    # Return True if the attempted password matches the stored password. Checking a bcrypt
+    # hash takes hundreds of milliseconds, so keep it off the event loop.
     try:
-        if check_password(password, document["password"]):
+        if await asyncio.get_running_loop().run_in_executor(
+            None, check_password, password, document["password"]
+        ):
             return True
     except TypeError:
         pass
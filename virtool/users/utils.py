@@ -1,4 +1,5 @@
 import hashlib
+import hmac
 
 import bcrypt
 
@@ -28,10 +29,13 @@ def check_legacy_password(password: str, salt: str, hashed: str) -> bool:
     :return: success of test
 
     """
-    return (
-        hashed
-        == hashlib.sha512(salt.encode("utf-8") + password.encode("utf-8")).hexdigest()
-    )
+    if not isinstance(hashed, str):
+        return False
+
+    digest = hashlib.sha512(salt.encode("utf-8"))
+    digest.update(password.encode("utf-8"))
+
+    return hmac.compare_digest(hashed, digest.hexdigest())
 
 
 def check_password(password: str, hashed: bytes) -> bool: